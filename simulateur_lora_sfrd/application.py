@@ -9,19 +9,39 @@ class Application:
     """Very small application that sends data at regular intervals."""
 
     def __init__(self, mac: LoRaMAC, interval: float = 60.0, payload: bytes | None = None) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive")
         self.mac = mac
         self.interval = interval
         self.payload = payload or b"ping"
         self.next_time = 0.0
 
+    # ------------------------------------------------------------------
+    def next_event_time(self) -> float:
+        """Return the simulated time of the next transmission."""
+
+        return self.next_time
+
+    # ------------------------------------------------------------------
+    def fire(self, current_time: float | None = None):
+        """Send the payload and schedule the next slot.
+
+        ``current_time`` defaults to :attr:`next_time` so that event-driven
+        callers can fire the application exactly when it is due.
+        """
+
+        if current_time is None:
+            current_time = self.next_time
+        frame = self.mac.send(self.payload)
+        self.next_time = current_time + self.interval
+        return frame
+
     # ------------------------------------------------------------------
     def step(self, current_time: float):
         """Send a payload if ``current_time`` reaches the next slot."""
 
         if current_time >= self.next_time:
-            frame = self.mac.send(self.payload)
-            self.next_time = current_time + self.interval
-            return frame
+            return self.fire(current_time)
         return None
 
 
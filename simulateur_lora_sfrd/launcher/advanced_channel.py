@@ -2,12 +2,181 @@
 
 from __future__ import annotations
 
+import functools
 import math
 import numpy as np
 
+from .channel import _GAIN_FLOOR_DB, _SF_GAIN_STEP_DB, _TEN_OVER_LN10, _default_rng
+
+try:  # pragma: no cover - optional acceleration
+    from numba import njit
+except Exception:  # pragma: no cover - numba may not be installed
+    njit = None
+
+
+def _obstacle_walk(
+    obstacles,
+    heights,
+    rows: int,
+    cols: int,
+    area: float,
+    x0: float,
+    y0: float,
+    z0: float,
+    dx: float,
+    dy: float,
+    dz: float,
+    default_dB: float,
+) -> float:
+    """Accumulate obstacle losses along a TX -> RX segment.
+
+    ``obstacles`` and ``heights`` are the row-major flattened maps (one float
+    per cell) or empty sequences when the corresponding map is absent.
+    Returns ``inf`` as soon as a blocking cell is crossed.
+    """
+    steps = max(cols, rows)
+    has_obstacles = len(obstacles) > 0
+    has_heights = len(heights) > 0
+    last = -1
+    loss = 0.0
+    for i in range(steps + 1):
+        t = i / steps
+        cx = int((x0 + dx * t) / area * cols)
+        cy = int((y0 + dy * t) / area * rows)
+        cx = min(max(cx, 0), cols - 1)
+        cy = min(max(cy, 0), rows - 1)
+        idx = cy * cols + cx
+        # x and y are monotonic along the segment: a cell left is never revisited
+        if idx == last:
+            continue
+        last = idx
+        if has_heights and heights[idx] > 0.0 and z0 + dz * t <= heights[idx]:
+            val = obstacles[idx] if has_obstacles else default_dB
+        elif has_obstacles:
+            val = obstacles[idx]
+        else:
+            continue
+        if val < 0:
+            return math.inf
+        if val > 0:
+            loss += val
+    return loss
+
+
+@functools.lru_cache(maxsize=64)
+def _symbol_times(bw: float) -> dict[int | None, float]:
+    """Symbol duration per SF (``None``: one chip) for bandwidth ``bw``.
+
+    Shared by all channels; only a handful of bandwidths are ever used.
+    """
+    times: dict[int | None, float] = {sf: (1 << sf) / bw for sf in range(5, 13)}
+    times[None] = 1.0 / bw
+    return times
+
+
+def _alignment_penalty_db(
+    freq_offset_hz: float,
+    sync_offset_s: float,
+    phase_offset_rad: float,
+    symbol_time: float,
+    half_bw: float,
+) -> float:
+    """Penalty (dB) for an interferer offset in frequency, time and phase.
+
+    ``half_bw`` is half the channel bandwidth (Hz).
+    """
+    freq_factor = abs(freq_offset_hz) / half_bw
+    time_factor = abs(sync_offset_s) / symbol_time
+    # Fully separated in frequency and time: no need for the phase term
+    if freq_factor >= 1.0 and time_factor >= 1.0:
+        return math.inf
+    # |sin(x / 2)| has period 2*pi: fold phases that drifted far away
+    if not -math.tau < phase_offset_rad < math.tau:
+        phase_offset_rad %= math.tau
+    if -1e-6 < phase_offset_rad < 1e-6:
+        # sin(x / 2) ~ x / 2 well below double precision of the sum
+        phase_sq = 0.25 * phase_offset_rad * phase_offset_rad
+    else:
+        s = math.sin(phase_offset_rad * 0.5)
+        phase_sq = s * s
+    penalty = 1.5 * (freq_factor * freq_factor + time_factor * time_factor + phase_sq)
+    return _TEN_OVER_LN10 * math.log1p(penalty)
+
+
+# fastmath without ``ninf``/``nnan``: the alignment kernel returns and compares
+# against ``inf`` for fully separated interferers.
+_INF_SAFE_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+if njit is not None:  # pragma: no cover - depends on numba
+    _obstacle_walk_nb = njit(cache=True, nogil=True)(_obstacle_walk)
+    _alignment_penalty_kernel = njit(cache=True, fastmath=_INF_SAFE_FASTMATH)(
+        _alignment_penalty_db
+    )
+else:
+    _obstacle_walk_nb = None
+    _alignment_penalty_kernel = _alignment_penalty_db
+
+
+class _GaussianPool:
+    """Standard normal variates drawn from ``rng`` by blocks of ``size``.
+
+    Only generators able to draw arrays (``standard_normal``) are pooled;
+    otherwise, or when ``size`` is ``0``, :attr:`draw` is a plain scalar
+    ``rng.normal(0, 1)`` call and the random stream is unchanged.
+    """
+
+    def __init__(self, rng: np.random.Generator, size: int = 0) -> None:
+        self.rng = rng
+        self.size = int(size) if hasattr(rng, "standard_normal") else 0
+        self._buf: list[float] = []
+        self._idx = 0
+        if self.size > 0:
+            self.draw = self._draw_pooled
+        else:
+            self.draw = self._scalar_draw()
+
+    def _scalar_draw(self):
+        return functools.partial(self.rng.normal, 0.0, 1.0)
+
+    def _block(self):
+        return self.rng.standard_normal(self.size)
+
+    def _draw_pooled(self) -> float:
+        idx = self._idx
+        if idx >= len(self._buf):
+            self._buf = self._block().tolist()
+            idx = 0
+        self._idx = idx + 1
+        return self._buf[idx]
+
+
+class _GammaPool(_GaussianPool):
+    """``Gamma(shape, scale)`` variates drawn by blocks like :class:`_GaussianPool`."""
+
+    def __init__(
+        self, rng: np.random.Generator, shape: float, scale: float, size: int = 0
+    ) -> None:
+        self.shape = shape
+        self.scale = scale
+        super().__init__(rng, size)
+
+    def _scalar_draw(self):
+        return functools.partial(self.rng.gamma, self.shape, self.scale)
+
+    def _block(self):
+        return self.rng.gamma(self.shape, self.scale, self.size)
+
 
 class _CorrelatedFading:
-    """Temporal correlation for Rayleigh/Rician/Nakagami fading."""
+    """Temporal correlation for Rayleigh/Rician/Nakagami fading.
+
+    ``method="ar1"`` (default) draws a first-order autoregressive process per
+    path. ``method="sos"`` evaluates a sum-of-sinusoids (Jakes) model with
+    ``n_sinusoids`` components whose phases are drawn once: no random draw is
+    needed per sample. ``doppler`` is then the maximum Doppler shift in cycles
+    per sample and the envelope has unit mean power. Nakagami fading always
+    uses the AR(1) form.
+    """
 
     def __init__(
         self,
@@ -16,6 +185,9 @@ class _CorrelatedFading:
         correlation: float,
         paths: int = 1,
         rng: np.random.Generator | None = None,
+        method: str = "ar1",
+        n_sinusoids: int = 16,
+        doppler: float = 0.05,
     ) -> None:
         self.kind = kind
         self.k = k_factor
@@ -24,37 +196,106 @@ class _CorrelatedFading:
         self.i = [0.0] * self.paths
         self.q = [0.0] * self.paths
         self.amp = 1.0
-        self.rng = rng or np.random.Generator(np.random.MT19937())
+        self.rng = rng or _default_rng()
+        self._gauss = functools.partial(self.rng.normal, 0.0, 1.0)
+        self.method = method
+        self.n_sinusoids = max(1, int(n_sinusoids))
+        self.doppler = doppler
+        self._configure()
+
+    def _configure(self) -> None:
+        """Precompute the constants used by :meth:`sample_db`."""
+        self._std = math.sqrt(max(1.0 - self.corr ** 2, 0.0))
+        if self.kind == "rician":
+            self._mean_i = math.sqrt(self.k / (self.k + 1.0))
+            self._sigma = math.sqrt(1.0 / (2.0 * (self.k + 1.0)))
+        else:
+            self._mean_i = 0.0
+            self._sigma = 1.0
+        self._nak_shape = max(self.k, 0.1)
+        self._nak_scale = 1.0 / self._nak_shape
+        self._gamma = None
+        self._sos = self.method == "sos" and self.kind in {"rayleigh", "rician"}
+        if self._sos:
+            m = self.n_sinusoids
+            w = 2.0 * math.pi * self.doppler
+            alphas = [2.0 * math.pi * (n + 0.5) / m for n in range(m)]
+            self._sos_wi = [w * math.cos(a) for a in alphas]
+            self._sos_wq = [w * math.sin(a) for a in alphas]
+            self._sos_phi_i = [2.0 * math.pi * self.rng.random() for _ in range(m)]
+            self._sos_phi_q = [2.0 * math.pi * self.rng.random() for _ in range(m)]
+            if self.kind == "rician":
+                self._sos_los = math.sqrt(self.k / (self.k + 1.0))
+                self._sos_scale = math.sqrt(1.0 / ((self.k + 1.0) * m))
+            else:
+                self._sos_los = 0.0
+                self._sos_scale = math.sqrt(1.0 / m)
+            self._sos_t = 0
+
+    def _sample_sos_db(self) -> float:
+        t = self._sos_t
+        self._sos_t = t + 1
+        cos = math.cos
+        sum_i = 0.0
+        for w, phi in zip(self._sos_wi, self._sos_phi_i):
+            sum_i += cos(w * t + phi)
+        sum_q = 0.0
+        for w, phi in zip(self._sos_wq, self._sos_phi_q):
+            sum_q += cos(w * t + phi)
+        scale = self._sos_scale
+        i_val = self._sos_los + scale * sum_i
+        q_val = scale * sum_q
+        amp = math.sqrt(i_val * i_val + q_val * q_val)
+        return 20 * math.log10(max(amp, 1e-12))
 
     def sample_db(self) -> float:
-        if self.kind not in {"rayleigh", "rician", "nakagami"}:
-            return 0.0
-        std = math.sqrt(max(1.0 - self.corr ** 2, 0.0))
-        if self.kind == "rayleigh":
-            mean_i = 0.0
-            sigma = 1.0
-        elif self.kind == "rician":
-            mean_i = math.sqrt(self.k / (self.k + 1.0))
-            sigma = math.sqrt(1.0 / (2.0 * (self.k + 1.0)))
-        else:  # nakagami
-            new_amp = math.sqrt(self.rng.gamma(max(self.k, 0.1), 1.0 / max(self.k, 0.1)))
+        if self._sos:
+            return self._sample_sos_db()
+        kind = self.kind
+        std = self._std
+        if kind == "nakagami":
+            if self._gamma is not None:
+                new_amp = math.sqrt(self._gamma())
+            else:
+                new_amp = math.sqrt(self.rng.gamma(self._nak_shape, self._nak_scale))
             self.amp = self.corr * self.amp + std * new_amp
             return 20 * math.log10(max(self.amp, 1e-12))
+        if kind != "rayleigh" and kind != "rician":
+            return 0.0
+
+        corr = self.corr
+        mean_i = self._mean_i
+        sigma = self._sigma
+        gauss = self._gauss
+        i_state = self.i
+        q_state = self.q
+        if self.paths == 1:
+            sum_i = corr * i_state[0] + std * (mean_i + sigma * gauss())
+            sum_q = corr * q_state[0] + std * (sigma * gauss())
+            i_state[0] = sum_i
+            q_state[0] = sum_q
+            amp = math.sqrt(sum_i * sum_i + sum_q * sum_q)
+            return 20 * math.log10(max(amp, 1e-12))
 
         sum_i = 0.0
         sum_q = 0.0
         for p in range(self.paths):
-            self.i[p] = self.corr * self.i[p] + std * self.rng.normal(mean_i, sigma)
-            self.q[p] = self.corr * self.q[p] + std * self.rng.normal(0.0, sigma)
-            sum_i += self.i[p]
-            sum_q += self.q[p]
-        amp = math.sqrt(sum_i ** 2 + sum_q ** 2) / self.paths
+            i_val = corr * i_state[p] + std * (mean_i + sigma * gauss())
+            q_val = corr * q_state[p] + std * (sigma * gauss())
+            i_state[p] = i_val
+            q_state[p] = q_val
+            sum_i += i_val
+            sum_q += q_val
+        amp = math.sqrt(sum_i * sum_i + sum_q * sum_q) / self.paths
         return 20 * math.log10(max(amp, 1e-12))
 
 
 class _CorrelatedValue:
     """Correlated random walk used for drifting offsets."""
 
+    # A dozen instances per channel, sampled on every packet
+    __slots__ = ("mean", "std", "corr", "value", "rng", "_gauss")
+
     def __init__(
         self,
         mean: float,
@@ -66,12 +307,18 @@ class _CorrelatedValue:
         self.std = std
         self.corr = correlation
         self.value = mean
-        self.rng = rng or np.random.Generator(np.random.MT19937())
+        self.rng = rng or _default_rng()
+        self._gauss = functools.partial(self.rng.normal, 0.0, 1.0)
 
     def sample(self) -> float:
+        if self.std <= 0.0:
+            # A disabled process resting on its mean stays there: skip the update
+            if self.value == self.mean:
+                return self.value
+            self.value = self.corr * self.value + (1.0 - self.corr) * self.mean
+            return self.value
         self.value = self.corr * self.value + (1.0 - self.corr) * self.mean
-        if self.std > 0.0:
-            self.value += self.rng.normal(0.0, self.std)
+        self.value += self.std * self._gauss()
         return self.value
 
 
@@ -132,6 +379,9 @@ class AdvancedChannel:
         cost231_correction_dB: float = 0.0,
         okumura_hata_correction_dB: float = 0.0,
         modem_snr_offsets: dict[str, float] | None = None,
+        fading_method: str = "ar1",
+        fading_doppler: float = 0.05,
+        rng_pool_size: int = 0,
         rng: np.random.Generator | None = None,
         **kwargs,
     ) -> None:
@@ -224,11 +474,19 @@ class AdvancedChannel:
             Okumura‑Hata.
         :param modem_snr_offsets: Dictionnaire ``{modem: offset}`` pour ajuster
             le SNR retourné selon le modem utilisé.
+        :param fading_method: ``ar1`` (processus autorégressif, défaut) ou
+            ``sos`` (somme de sinusoïdes de Jakes, sans tirage aléatoire par
+            paquet) pour le fading Rayleigh/Rician.
+        :param fading_doppler: Décalage Doppler maximal (cycles par échantillon)
+            du modèle ``sos``.
+        :param rng_pool_size: Si positif et si ``rng`` sait tirer des tableaux,
+            les tirages gaussiens sont effectués par blocs de cette taille
+            plutôt qu'un par un.
         """
 
         from .channel import Channel
 
-        self.rng = rng or np.random.Generator(np.random.MT19937())
+        self.rng = rng or _default_rng()
         self.base = Channel(
             fine_fading_std=fine_fading_std,
             fading_correlation=fading_correlation,
@@ -250,7 +508,13 @@ class AdvancedChannel:
         self.nakagami_m = nakagami_m
         k_param = rician_k if fading != "nakagami" else nakagami_m
         self.fading_model = _CorrelatedFading(
-            fading, k_param, fading_correlation, paths=multipath_paths, rng=self.rng
+            fading,
+            k_param,
+            fading_correlation,
+            paths=multipath_paths,
+            rng=self.rng,
+            method=fading_method,
+            doppler=fading_doppler,
         )
         self.terrain = terrain.lower()
         self.weather_loss_dB_per_km = weather_loss_dB_per_km
@@ -338,14 +602,44 @@ class AdvancedChannel:
             self._cols = len((obstacle_map or obstacle_height_map)[0]) if self._rows else 0
         else:
             self._rows = self._cols = 0
+        # Maps resolved once to row-major floats; named obstacles and the
+        # default penalty are looked up here, not per sampled cell.
+        self._obstacle_flat = None
+        if self._rows:
+            obstacles, heights = self._flatten_obstacle_maps()
+            if _obstacle_walk_nb is not None:  # pragma: no cover - numba only
+                obstacles = np.asarray(obstacles, dtype=np.float64)
+                heights = np.asarray(heights, dtype=np.float64)
+            self._obstacle_flat = (obstacles, heights)
         self.cost231_correction_dB = float(cost231_correction_dB)
         self.okumura_hata_correction_dB = float(okumura_hata_correction_dB)
         self.modem_snr_offsets = modem_snr_offsets or {}
+        self._modem_offset = 0.0
+        self._rebuild_pl_constants()
+        self._gauss = _GaussianPool(self.rng, rng_pool_size).draw
+        for value in vars(self).values():
+            if isinstance(value, (_CorrelatedValue, _CorrelatedFading)) and value.rng is self.rng:
+                value._gauss = self._gauss
+        fading_model = self.fading_model
+        if fading_model.kind == "nakagami" and fading_model.rng is self.rng:
+            gamma_pool = _GammaPool(
+                self.rng, fading_model._nak_shape, fading_model._nak_scale, rng_pool_size
+            )
+            if gamma_pool.size > 0:
+                fading_model._gamma = gamma_pool.draw
 
     def __getattr__(self, name: str):
         """Delegate attribute access to the underlying :class:`Channel`."""
         return getattr(self.base, name)
 
+    def bind_modem(self, modem: str | None) -> None:
+        """Apply the ``modem_snr_offsets`` entry of ``modem`` by default.
+
+        :meth:`compute_rssi` then adds this offset whenever it is called
+        without an explicit ``modem``. ``None`` removes the binding.
+        """
+        self._modem_offset = self.modem_snr_offsets.get(modem, 0.0) if modem else 0.0
+
     def noise_floor_dBm(self) -> float:
         """Return the noise floor computed by the base channel."""
         return self.base.noise_floor_dBm()
@@ -391,54 +685,75 @@ class AdvancedChannel:
     def stop_rx(self) -> None:
         self.rx_state = "off"
 
-    def update(self, dt: float) -> None:
-        """Advance internal timers by ``dt`` seconds."""
-        if self.tx_state == "starting":
-            self._tx_timer -= dt
-            if self._tx_timer <= 0.0:
-                if self.pa_ramp_up_s > 0.0:
-                    self.tx_state = "ramping_up"
-                    self._tx_timer = self.pa_ramp_up_s
-                    self._tx_level = 0.0
-                else:
-                    self.tx_state = "on"
-                    self._tx_level = 1.0
-        elif self.tx_state == "ramping_up":
-            self._tx_timer -= dt
-            self._tx_level = 1.0 - max(self._tx_timer, 0.0) / self.pa_ramp_up_s
-            if self._tx_timer <= 0.0:
+    def _tx_starting(self, dt: float) -> None:
+        self._tx_timer -= dt
+        if self._tx_timer <= 0.0:
+            if self.pa_ramp_up_s > 0.0:
+                self.tx_state = "ramping_up"
+                self._tx_timer = self.pa_ramp_up_s
+                self._tx_level = 0.0
+            else:
                 self.tx_state = "on"
                 self._tx_level = 1.0
-        elif self.tx_state == "ramping_down":
-            self._tx_timer -= dt
-            self._tx_level = max(self._tx_timer, 0.0) / self.pa_ramp_down_s
-            if self._tx_timer <= 0.0:
-                self.tx_state = "off"
-                self._tx_level = 0.0
+
+    def _tx_ramping_up(self, dt: float) -> None:
+        self._tx_timer -= dt
+        self._tx_level = 1.0 - max(self._tx_timer, 0.0) / self.pa_ramp_up_s
+        if self._tx_timer <= 0.0:
+            self.tx_state = "on"
+            self._tx_level = 1.0
+
+    def _tx_ramping_down(self, dt: float) -> None:
+        self._tx_timer -= dt
+        self._tx_level = max(self._tx_timer, 0.0) / self.pa_ramp_down_s
+        if self._tx_timer <= 0.0:
+            self.tx_state = "off"
+            self._tx_level = 0.0
+
+    # Transient transmitter states and their timer handlers; "on" and "off"
+    # are steady and need no work.
+    _TX_STEPS = {
+        "starting": _tx_starting,
+        "ramping_up": _tx_ramping_up,
+        "ramping_down": _tx_ramping_down,
+    }
+
+    def update(self, dt: float) -> None:
+        """Advance internal timers by ``dt`` seconds."""
+        step = self._TX_STEPS.get(self.tx_state)
+        if step is not None:
+            step(self, dt)
         if self.rx_state == "starting":
             self._rx_timer -= dt
             if self._rx_timer <= 0.0:
                 self.rx_state = "on"
 
+    @staticmethod
+    def update_many(channels, dt: float) -> None:
+        """Advance the timers of several channels, skipping steady ones."""
+        steps = AdvancedChannel._TX_STEPS
+        for ch in channels:
+            if ch.tx_state in steps or ch.rx_state == "starting":
+                ch.update(dt)
+
     # ------------------------------------------------------------------
     # Propagation models
     # ------------------------------------------------------------------
     def path_loss(self, distance: float, height_diff: float | None = None) -> float:
         """Return path loss in dB for the selected model."""
         if height_diff is not None:
-            d = math.sqrt(distance ** 2 + height_diff ** 2)
+            d = math.hypot(distance, height_diff)
         else:
             d = distance
         if self.propagation_model == "3d":
-            if height_diff is None:
-                height_diff = self.base_station_height - self.mobile_height
             loss = self.base.path_loss(d)
         elif self.propagation_model == "cost231":
             loss = self._cost231_loss(d) + self.cost231_correction_dB
         elif self.propagation_model == "cost231_3d":
             if height_diff is None:
-                height_diff = self.base_station_height - self.mobile_height
-            d3d = math.sqrt(distance ** 2 + height_diff ** 2)
+                d3d = math.hypot(distance, self.base_station_height - self.mobile_height)
+            else:
+                d3d = d
             loss = self._cost231_loss(d3d) + self.cost231_correction_dB
         elif self.propagation_model == "okumura_hata":
             loss = self._okumura_hata_loss(d) + self.okumura_hata_correction_dB
@@ -453,114 +768,90 @@ class AdvancedChannel:
         return loss
 
     # ------------------------------------------------------------------
+    def _flatten_obstacle_maps(self) -> tuple[list[float], list[float]]:
+        """Return the obstacle and height maps as row-major lists of floats.
+
+        Named obstacles are resolved through ``obstacle_losses`` and heights
+        that are not numeric are treated as ``0`` (no obstruction).
+        """
+        obstacles: list[float] = []
+        if self.obstacle_map:
+            for row in self.obstacle_map:
+                for val in row:
+                    if isinstance(val, str):
+                        val = self.obstacle_losses.get(val, self.default_obstacle_dB)
+                    obstacles.append(float(val))
+        heights: list[float] = []
+        if self.obstacle_height_map:
+            for row in self.obstacle_height_map:
+                for val in row:
+                    try:
+                        heights.append(float(val))
+                    except (TypeError, ValueError):
+                        heights.append(0.0)
+        return obstacles, heights
+
     def _obstacle_loss(
         self,
         tx_pos: tuple[float, float, float] | tuple[float, float],
         rx_pos: tuple[float, float, float] | tuple[float, float],
     ) -> float:
         """Compute additional loss due to obstacles between two points."""
-        if (
-            not self.obstacle_map
-            and not self.obstacle_height_map
-            or not self.map_area_size
-            or self._rows == 0
-        ):
+        if self._obstacle_flat is None or not self.map_area_size:
             return 0.0
-        visited: set[tuple[int, int]] = set()
-        steps = max(self._cols, self._rows)
-        loss = 0.0
-        for i in range(steps + 1):
-            t = i / steps
-            x = tx_pos[0] + (rx_pos[0] - tx_pos[0]) * t
-            y = tx_pos[1] + (rx_pos[1] - tx_pos[1]) * t
-            if len(tx_pos) >= 3 and len(rx_pos) >= 3:
-                z = tx_pos[2] + (rx_pos[2] - tx_pos[2]) * t
-            else:
-                z = 0.0
-            cx = int(x / self.map_area_size * self._cols)
-            cy = int(y / self.map_area_size * self._rows)
-            cx = min(max(cx, 0), self._cols - 1)
-            cy = min(max(cy, 0), self._rows - 1)
-            cell = (cy, cx)
-            if cell in visited:
-                continue
-            visited.add(cell)
-            obstacle_val = None
-            if self.obstacle_map:
-                obstacle_val = self.obstacle_map[cy][cx]
-                if isinstance(obstacle_val, str):
-                    obstacle_val = self.obstacle_losses.get(obstacle_val, self.default_obstacle_dB)
-                else:
-                    obstacle_val = float(obstacle_val)
-            height = None
-            if self.obstacle_height_map:
-                height_val = self.obstacle_height_map[cy][cx]
-                try:
-                    height = float(height_val)
-                except (TypeError, ValueError):
-                    height = None
-            if height is not None and height > 0.0 and z <= height:
-                val = (
-                    obstacle_val
-                    if obstacle_val is not None
-                    else self.default_obstacle_dB
-                )
-                if val < 0:
-                    return float("inf")
-                if val > 0:
-                    loss += val
-                continue
-            if obstacle_val is not None:
-                if obstacle_val < 0:
-                    return float("inf")
-                if obstacle_val > 0:
-                    loss += obstacle_val
-        return loss
+        cols = self._cols
+        rows = self._rows
+        area = self.map_area_size
+        obstacles, heights = self._obstacle_flat
+        # Origin and direction of the sampled TX -> RX segment
+        x0 = tx_pos[0]
+        y0 = tx_pos[1]
+        dx = rx_pos[0] - x0
+        dy = rx_pos[1] - y0
+        if len(tx_pos) >= 3 and len(rx_pos) >= 3:
+            z0 = tx_pos[2]
+            dz = rx_pos[2] - z0
+        else:
+            z0 = dz = 0.0
+        walk = _obstacle_walk_nb if _obstacle_walk_nb is not None else _obstacle_walk
+        return walk(
+            obstacles, heights, rows, cols, float(area),
+            x0, y0, z0, dx, dy, dz, self.default_obstacle_dB,
+        )
+
+    def _rebuild_pl_constants(self) -> None:
+        """Precompute the distance-independent terms of the path loss models.
+
+        Must be called again if ``frequency_hz``, the antenna heights or
+        ``terrain`` are changed after construction.
+        """
+        freq_mhz = self.base.frequency_hz / 1e6
+        lf = math.log10(freq_mhz)
+        lhb = math.log10(self.base_station_height)
+        a_hm = (1.1 * lf - 0.7) * self.mobile_height - (1.56 * lf - 0.8)
+        self._hata_slope = 44.9 - 6.55 * lhb
+        self._c231_const = 46.3 + 33.9 * lf - 13.82 * lhb - a_hm
+        oh_const = 69.55 + 26.16 * lf - 13.82 * lhb - a_hm
+        if self.terrain == "suburban":
+            oh_const -= 2 * (math.log10(freq_mhz / 28.0)) ** 2 - 5.4
+        elif self.terrain == "open":
+            oh_const -= 4.78 * lf ** 2 - 18.33 * lf + 40.94
+        self._oh_const = oh_const
+        self._itu_const = 20 * lf + 28
 
     def _cost231_loss(self, distance: float) -> float:
         distance_km = max(distance / 1000.0, 1e-3)
-        freq_mhz = self.base.frequency_hz / 1e6
-        a_hm = (
-            (1.1 * math.log10(freq_mhz) - 0.7) * self.mobile_height
-            - (1.56 * math.log10(freq_mhz) - 0.8)
-        )
-        return (
-            46.3
-            + 33.9 * math.log10(freq_mhz)
-            - 13.82 * math.log10(self.base_station_height)
-            - a_hm
-            + (44.9 - 6.55 * math.log10(self.base_station_height))
-            * math.log10(distance_km)
-        )
+        return self._c231_const + self._hata_slope * math.log10(distance_km)
 
     def _okumura_hata_loss(self, distance: float) -> float:
         distance_km = max(distance / 1000.0, 1e-3)
-        freq_mhz = self.base.frequency_hz / 1e6
-        hb = self.base_station_height
-        hm = self.mobile_height
-        a_hm = (
-            (1.1 * math.log10(freq_mhz) - 0.7) * hm
-            - (1.56 * math.log10(freq_mhz) - 0.8)
-        )
-        pl = (
-            69.55
-            + 26.16 * math.log10(freq_mhz)
-            - 13.82 * math.log10(hb)
-            - a_hm
-            + (44.9 - 6.55 * math.log10(hb)) * math.log10(distance_km)
-        )
-        if self.terrain == "suburban":
-            pl -= 2 * (math.log10(freq_mhz / 28.0)) ** 2 - 5.4
-        elif self.terrain == "open":
-            pl -= 4.78 * (math.log10(freq_mhz)) ** 2 - 18.33 * math.log10(freq_mhz) + 40.94
-        return pl
+        return self._oh_const + self._hata_slope * math.log10(distance_km)
 
     def _itu_indoor_loss(self, distance: float) -> float:
         """Simple ITU indoor path loss model."""
         d = max(distance, 1.0)
-        freq_mhz = self.base.frequency_hz / 1e6
         n = 30.0
-        loss = 20 * math.log10(freq_mhz) + n * math.log10(d) + 28
+        loss = self._itu_const + n * math.log10(d)
         loss += self.indoor_floor_loss_dB * max(self.indoor_n_floors - 1, 0)
         return loss
 
@@ -587,21 +878,25 @@ class AdvancedChannel:
         configured at construction.
         ``tx_pos`` and ``rx_pos`` may include an optional altitude as third
         coordinate to interact with ``obstacle_height_map``.
-        ``modem`` selects an optional SNR offset from ``modem_snr_offsets``.
+        ``modem`` selects an optional SNR offset from ``modem_snr_offsets``;
+        when omitted, the modem set with :meth:`bind_modem` applies.
         """
         if self.rx_state != "on":
             return -float("inf"), -float("inf")
+        # Bind the wrapped channel and RNG once for the many lookups below
+        base = self.base
+        gauss = self._gauss
         if freq_offset_hz is None:
             freq_offset_hz = self._freq_offset.sample()
         # Include time-varying frequency drift
-        freq_offset_hz += self.base.omnet.frequency_drift()
+        freq_offset_hz += base.omnet.frequency_drift()
         freq_offset_hz += self._dev_freq_offset.sample()
         if sync_offset_s is None:
             sync_offset_s = self._sync_offset.sample()
         # Include short-term clock jitter
-        sync_offset_s += self.base.omnet.clock_drift()
+        sync_offset_s += base.omnet.clock_drift()
         if self.clock_jitter_std_s > 0.0:
-            sync_offset_s += self.rng.normal(0.0, self.clock_jitter_std_s)
+            sync_offset_s += self.clock_jitter_std_s * gauss()
 
         height_diff = None
         if tx_pos is not None and rx_pos is not None and len(tx_pos) >= 3 and len(rx_pos) >= 3:
@@ -612,8 +907,8 @@ class AdvancedChannel:
             if extra == float("inf"):
                 return -float("inf"), -float("inf")
             loss += extra + self._obstacle_var.sample()
-        if self.base.shadowing_std > 0:
-            loss += self.rng.normal(0, self.base.shadowing_std)
+        if base.shadowing_std > 0:
+            loss += base.shadowing_std * gauss()
 
         tx_power_dBm += self._pa_nl.sample()
         tx_power_dBm += self._pa_distortion.sample()
@@ -624,70 +919,67 @@ class AdvancedChannel:
             tx_power_dBm += 20.0 * math.log10(max(self._tx_level, 1e-3))
         rssi = (
             tx_power_dBm
-            + self.base.tx_antenna_gain_dB
-            + self.base.rx_antenna_gain_dB
+            + base.tx_antenna_gain_dB
+            + base.rx_antenna_gain_dB
             - loss
-            - self.base.cable_loss_dB
+            - base.cable_loss_dB
         )
-        if self.base.tx_power_std > 0:
+        if base.tx_power_std > 0:
             rssi += self._tx_power_var.sample()
-        if self.base.fast_fading_std > 0:
-            rssi += self.rng.normal(0, self.base.fast_fading_std)
-        if self.base.time_variation_std > 0:
-            rssi += self.rng.normal(0, self.base.time_variation_std)
-        rssi += self.base.omnet.fine_fading()
+        if base.fast_fading_std > 0:
+            rssi += base.fast_fading_std * gauss()
+        if base.time_variation_std > 0:
+            rssi += base.time_variation_std * gauss()
+        rssi += base.omnet.fine_fading()
 
         if tx_angle is not None and rx_angle is not None and tx_pos and rx_pos:
             dx = rx_pos[0] - tx_pos[0]
             dy = rx_pos[1] - tx_pos[1]
             los = math.atan2(dy, dx)
-            tx_diff = abs((los - tx_angle + math.pi) % (2 * math.pi) - math.pi)
-            rx_diff = abs((los + math.pi - rx_angle + math.pi) % (2 * math.pi) - math.pi)
+            tx_diff = abs(math.remainder(los - tx_angle, math.tau))
+            rx_diff = abs(math.remainder(los + math.pi - rx_angle, math.tau))
             rssi += self._directional_gain(tx_diff)
             rssi += self._directional_gain(rx_diff)
 
         temperature = self._temperature.sample()
         model = (
-            self.base.omnet_phy.model
-            if getattr(self.base, "omnet_phy", None)
-            else self.base.omnet
+            base.omnet_phy.model
+            if getattr(base, "omnet_phy", None)
+            else base.omnet
         )
-        original_temp = model.temperature_K
-        model.temperature_K = temperature
-        eff_bw = min(self.base.bandwidth, self.base.frontend_filter_bw)
-        thermal = model.thermal_noise_dBm(eff_bw)
-        model.temperature_K = original_temp
-        if self.base.phy_model == "flora_full" and sf is not None:
-            noise = self.base._flora_noise_dBm(sf)
+        eff_bw = min(base.bandwidth, base.frontend_filter_bw)
+        thermal = model.thermal_noise_dBm(eff_bw, temperature)
+        if base.phy_model == "flora_full" and sf is not None:
+            noise = base._flora_noise_dBm(sf)
         else:
-            noise = thermal + self.base.noise_figure_dB + self.base.interference_dB
-        noise += self.base.humidity_noise_coeff_dB * (self._humidity.sample() / 100.0)
-        for f, bw, power in self.base.band_interference:
-            half = (bw + self.base.bandwidth) / 2.0
-            diff = abs(self.base.frequency_hz - f)
-            if diff <= half:
-                noise += power
-            elif self.base.adjacent_interference_dB > 0 and diff <= half + self.base.bandwidth:
-                noise += max(power - self.base.adjacent_interference_dB, 0.0)
-        if self.base.noise_floor_std > 0:
-            noise += self.rng.normal(0, self.base.noise_floor_std)
-        if self.base.impulsive_noise_prob > 0.0 and self.rng.random() < self.base.impulsive_noise_prob:
-            noise += self.base.impulsive_noise_dB
+            noise = thermal + base.noise_figure_dB + base.interference_dB
+        noise += base.humidity_noise_coeff_dB * (self._humidity.sample() / 100.0)
+        if base._band_interference:
+            noise += base._band_interference_dB()
+        if base.noise_floor_std > 0:
+            noise += base.noise_floor_std * gauss()
+        if base.impulsive_noise_prob > 0.0 and self.rng.random() < base.impulsive_noise_prob:
+            noise += base.impulsive_noise_dB
         noise += model.noise_variation()
         rssi += self.fading_model.sample_db()
 
-        rssi -= self.base._filter_attenuation_db(freq_offset_hz)
+        rssi -= base._filter_attenuation_db(freq_offset_hz)
 
         phase = self._phase_offset.sample()
         # Additional penalty if transmissions are not perfectly aligned
         penalty = self._interference_penalty_db(freq_offset_hz, sync_offset_s, phase, sf)
         noise += penalty
 
-        snr = rssi - noise - abs(self._phase_noise.sample())
+        snr = rssi - noise
+        phase_noise = self._phase_noise
+        if phase_noise.std > 0.0 or phase_noise.value != 0.0:
+            snr -= abs(phase_noise.sample())
         if sf is not None:
-            snr += 10 * math.log10(2 ** sf)
-        if modem and modem in self.modem_snr_offsets:
-            snr += self.modem_snr_offsets[modem]
+            snr += sf * _SF_GAIN_STEP_DB
+        if modem:
+            snr += self.modem_snr_offsets.get(modem, 0.0)
+        elif self._modem_offset:
+            snr += self._modem_offset
         return rssi, snr
 
     # ------------------------------------------------------------------
@@ -700,19 +992,18 @@ class AdvancedChannel:
     ) -> float:
         """Simple penalty model for imperfect alignment."""
         bw = self.base.bandwidth
-        freq_factor = abs(freq_offset_hz) / (bw / 2.0)
-        if sf is not None:
-            symbol_time = (2 ** sf) / bw
-        else:
-            symbol_time = 1.0 / bw
-        time_factor = abs(sync_offset_s) / symbol_time
-        if freq_factor >= 1.0 and time_factor >= 1.0:
-            return float("inf")
-        phase_factor = abs(math.sin(phase_offset_rad / 2.0))
-        penalty = 1.5 * (freq_factor ** 2 + time_factor ** 2 + phase_factor ** 2)
-        return 10 * math.log10(1.0 + penalty)
+        symbol_time = _symbol_times(bw).get(sf)
+        if symbol_time is None:
+            symbol_time = (1 << sf) / bw
+        return _alignment_penalty_kernel(
+            freq_offset_hz, sync_offset_s, phase_offset_rad, symbol_time, bw * 0.5
+        )
 
     def _directional_gain(self, angle_rad: float) -> float:
         """Simple cosine-squared antenna pattern."""
-        gain = max(math.cos(angle_rad), 0.0) ** 2
-        return 10 * math.log10(max(gain, 1e-3))
+        c = math.cos(angle_rad)
+        gain = c * c
+        # Back lobe and deep side lobes share the clamped floor
+        if c <= 0.0 or gain <= 1e-3:
+            return _GAIN_FLOOR_DB
+        return _TEN_OVER_LN10 * math.log(gain)
@@ -1,13 +1,113 @@
+import functools
+import logging
 import math
 import os
 import re
+import sys
 import numpy as np
 from .omnet_model import OmnetModel
 
+try:  # pragma: no cover - optional acceleration
+    from numba import njit
+except Exception:  # pragma: no cover - numba may not be installed
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Single pass over LoRaAnalogModel.cc: either an SF header or a BW/noise entry
+_FLORA_NOISE_RE = re.compile(
+    r"getLoRaSF\(\) == (?P<sf>\d+)"
+    r"|getLoRaBW\(\) == Hz\((?P<bw>\d+)\).*dBmW2mW\((?P<val>-?\d+)\)"
+)
+# 10 / ln(10) : convertit un logarithme népérien en décibels
+_TEN_OVER_LN10 = 10.0 / math.log(10.0)
+# Plancher du diagramme d'antenne en cosinus carré (gain borné à 1e-3)
+_GAIN_FLOOR_DB = _TEN_OVER_LN10 * math.log(1e-3)
+# Gain d'étalement par unité de SF : 10 log10(2^SF) = SF * 10 log10(2)
+# (égalité exacte en double précision pour SF <= 63)
+_SF_GAIN_STEP_DB = 10 * math.log10(2.0)
+# Parsed noise tables keyed by (real path, mtime), shared by all channels
+_FLORA_TABLE_CACHE: dict[tuple[str, float], dict[int, dict[int, float]]] = {}
+
+
+def _default_rng() -> np.random.Generator:
+    """Return a fresh generator for components created without ``rng``.
+
+    ``SFC64`` then ``PCG64`` draw faster than ``MT19937``; the fastest
+    available is used. Unseeded defaults are not reproducible anyway, and
+    callers needing a given stream pass their own ``rng``.
+    """
+    bit_generator = (
+        getattr(np.random, "SFC64", None)
+        or getattr(np.random, "PCG64", None)
+        or np.random.MT19937
+    )
+    return np.random.Generator(bit_generator())
+
+
+def _butterworth_attenuation_db(freq_offset_hz: float, fc: float, order: int) -> float:
+    """Atténuation (dB) d'un filtre de Butterworth d'ordre ``order``.
+
+    |H(jw)|^2 = 1 / (1 + (w/wc)^(2n)), soit 10 log10(1 + ratio^(2n)) en dB.
+    """
+    ratio = abs(freq_offset_hz) / fc
+    if ratio <= 0.0:
+        return 0.0
+    # Ordres usuels : quelques multiplications plutôt qu'un appel à pow()
+    x = ratio * ratio
+    if order == 1:
+        p = x
+    elif order == 2:
+        p = x * x
+    elif order == 3:
+        p = x * x * x
+    elif order == 4:
+        t = x * x
+        p = t * t
+    else:
+        p = ratio ** (2 * order)
+    return _TEN_OVER_LN10 * math.log1p(p)
+
+
+def _rayleigh_paths_db(i: float, q: float, taps: int) -> float:
+    """Gain (dB) de ``taps`` trajets dont les composantes I/Q sont sommées."""
+    amp = math.sqrt(i * i + q * q) / math.sqrt(taps)
+    return 20.0 * math.log10(max(amp, 1e-12))
+
+
+if njit is not None:  # pragma: no cover - depends on numba
+    _butterworth_attenuation_nb = njit(cache=True, fastmath=True)(
+        _butterworth_attenuation_db
+    )
+    _rayleigh_paths_nb = njit(cache=True, fastmath=True)(_rayleigh_paths_db)
+    try:
+        # Compile now rather than on the first packet
+        _butterworth_attenuation_nb(1.0, 1.0, 1)
+        _rayleigh_paths_nb(1.0, 1.0, 2)
+    except Exception as exc:
+        logger.warning(
+            "Compilation numba impossible, noyaux Python conservés : %s", exc
+        )
+    else:
+        _butterworth_attenuation_db = _butterworth_attenuation_nb
+        _rayleigh_paths_db = _rayleigh_paths_nb
+
+
+def _orientation_vector(angle: float | tuple[float, float]) -> tuple[float, float, float]:
+    """Vecteur unitaire d'une antenne orientée (azimut ou (azimut, élévation))."""
+    if isinstance(angle, (tuple, list)):
+        az, el = angle
+        cos_el = math.cos(el)
+        return cos_el * math.cos(az), cos_el * math.sin(az), math.sin(el)
+    return math.cos(angle), math.sin(angle), 0.0
+
 
 class _CorrelatedValue:
     """Correlated random walk used for optional impairments."""
 
+    # Five instances per channel, sampled on every packet
+    __slots__ = ("mean", "std", "corr", "value", "rng")
+
     def __init__(
         self,
         mean: float,
@@ -19,14 +119,89 @@ class _CorrelatedValue:
         self.std = std
         self.corr = correlation
         self.value = mean
-        self.rng = rng or np.random.Generator(np.random.MT19937())
+        self.rng = rng or _default_rng()
 
     def sample(self) -> float:
+        if self.std <= 0.0:
+            # Processus désactivé et au repos sur sa moyenne : rien à mettre à jour
+            if self.value == self.mean:
+                return self.value
+            self.value = self.corr * self.value + (1.0 - self.corr) * self.mean
+            return self.value
         self.value = self.corr * self.value + (1.0 - self.corr) * self.mean
-        if self.std > 0.0:
-            self.value += self.rng.normal(0.0, self.std)
+        self.value += self.rng.normal(0.0, self.std)
         return self.value
 
+
+class _BandInterference(list):
+    """Liste de brouilleurs ``(freq, bw, dB)`` qui compte ses modifications.
+
+    Les entrées sont figées en tuples et chaque mutation de la liste
+    incrémente ``version`` : le canal invalide ainsi ses sommes mémorisées
+    sans comparer les brouilleurs un à un à chaque paquet.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, entries=()) -> None:
+        super().__init__(tuple(entry) for entry in entries)
+        self.version = 0
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = [tuple(entry) for entry in value]
+        else:
+            value = tuple(value)
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self.version += 1
+        return result
+
+    def append(self, entry) -> None:
+        super().append(tuple(entry))
+        self.version += 1
+
+    def extend(self, entries) -> None:
+        super().extend(tuple(entry) for entry in entries)
+        self.version += 1
+
+    def insert(self, index, entry) -> None:
+        super().insert(index, tuple(entry))
+        self.version += 1
+
+    def pop(self, index=-1):
+        entry = super().pop(index)
+        self.version += 1
+        return entry
+
+    def remove(self, entry) -> None:
+        super().remove(tuple(entry))
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+
 class Channel:
     """Représente le canal de propagation radio pour LoRa."""
 
@@ -66,22 +241,30 @@ class Channel:
 
     @staticmethod
     def parse_flora_noise_table(path: str | os.PathLike) -> dict[int, dict[int, float]]:
-        """Parse LoRaAnalogModel.cc to load exact noise values."""
-        text = open(path, "r").read()
+        """Parse LoRaAnalogModel.cc to load exact noise values.
+
+        The result is cached per file and reparsed only if the file changes.
+        Each call returns a fresh copy, so callers may edit it freely.
+        """
+        real = os.path.realpath(path)
+        key = (real, os.path.getmtime(real))
+        cached = _FLORA_TABLE_CACHE.get(key)
+        if cached is None:
+            cached = _FLORA_TABLE_CACHE[key] = Channel._read_flora_noise_table(real)
+        return {sf: dict(row) for sf, row in cached.items()}
+
+    @staticmethod
+    def _read_flora_noise_table(real: str) -> dict[int, dict[int, float]]:
+        with open(real, "r") as f:
+            text = f.read()
         table: dict[int, dict[int, float]] = {}
-        current_sf: int | None = None
-        for line in text.splitlines():
-            m_sf = re.search(r"getLoRaSF\(\) == (\d+)", line)
-            if m_sf:
-                current_sf = int(m_sf.group(1))
-                table[current_sf] = {}
-                continue
-            if current_sf is not None:
-                m_bw = re.search(r"getLoRaBW\(\) == Hz\((\d+)\).*dBmW2mW\((-?\d+)\)", line)
-                if m_bw:
-                    bw = int(m_bw.group(1))
-                    val = int(m_bw.group(2))
-                    table[current_sf][bw] = val
+        current: dict[int, float] | None = None
+        for m in _FLORA_NOISE_RE.finditer(text):
+            sf = m.group("sf")
+            if sf is not None:
+                current = table[int(sf)] = {}
+            elif current is not None:
+                current[int(m.group("bw"))] = int(m.group("val"))
         return table
 
     def __init__(
@@ -262,7 +445,7 @@ class Channel:
             self.environment = None
 
         if region is not None:
-            reg = region.upper()
+            reg = sys.intern(region.upper())
             if reg not in self.REGION_CHANNELS:
                 raise ValueError(f"Unknown region preset: {region}")
             freqs = self.REGION_CHANNELS[reg]
@@ -275,7 +458,7 @@ class Channel:
             self.region = None
             self.channel_index = channel_index
 
-        self.rng = rng or np.random.Generator(np.random.MT19937())
+        self.rng = rng or _default_rng()
         self.frequency_hz = frequency_hz
         self.path_loss_exp = path_loss_exp
         self.shadowing_std = shadowing_std  # σ en dB (ex: 6.0 pour environnement urbain/suburbain)
@@ -295,7 +478,7 @@ class Channel:
         self.noise_floor_std = noise_floor_std
         self.tx_power_std = tx_power_std
         self.interference_dB = interference_dB
-        self.band_interference = list(band_interference or [])
+        self.band_interference = band_interference
         self.detection_threshold_dBm = detection_threshold_dBm
         self.frequency_offset_hz = frequency_offset_hz
         self.freq_offset_std_hz = freq_offset_std_hz
@@ -316,6 +499,10 @@ class Channel:
         self.humidity_noise_coeff_dB = humidity_noise_coeff_dB
         self.frontend_filter_order = int(frontend_filter_order)
         self.frontend_filter_bw = float(frontend_filter_bw) if frontend_filter_bw is not None else bandwidth
+        self._band_db_key: tuple | None = None
+        self._band_db = 0.0
+        self._band_mw_key: tuple | None = None
+        self._band_mw = 0.0
         self.pa_ramp_up_s = float(pa_ramp_up_s)
         self.pa_ramp_down_s = float(pa_ramp_down_s)
         self.impulsive_noise_prob = float(impulsive_noise_prob)
@@ -369,7 +556,6 @@ class Channel:
         # Low Data Rate Optimization activée au-delà de ce SF
         self.low_data_rate_threshold = 11  # SF >= 11 -> Low Data Rate Optimization activée
 
-        self._update_sensitivity()
         # Seuil de capture (différence de RSSI en dB pour qu'un signal plus fort capture la réception)
         self.capture_threshold_dB = capture_threshold_dB
         self.capture_window_symbols = int(capture_window_symbols)
@@ -431,43 +617,111 @@ class Channel:
             noise = self.omnet_phy.noise_floor()
             self.last_noise_dBm = noise
             return noise
+        omnet = self.omnet
         temp = self._temperature.sample()
-        original = self.omnet.temperature_K
-        self.omnet.temperature_K = temp
+        original = omnet.temperature_K
+        omnet.temperature_K = temp
         eff_bw = min(self.bandwidth, self.frontend_filter_bw)
-        thermal = self.omnet.variable_thermal_noise_dBm(eff_bw)
-        self.omnet.temperature_K = original
+        thermal = omnet.variable_thermal_noise_dBm(eff_bw)
+        omnet.temperature_K = original
         base = thermal + self.noise_figure_dB
-        power = 10 ** (base / 10.0)
+        base_mw = 10 ** (base / 10.0)
+        power = base_mw
         if self.interference_dB != 0.0:
-            power += 10 ** ((self.interference_dB - self._filter_attenuation_db(freq_offset_hz)) / 10.0)
+            att = self._filter_attenuation_db(freq_offset_hz)
+            power += 10 ** ((self.interference_dB - att) / 10.0)
         hum = self.humidity_noise_coeff_dB * (self._humidity.sample() / 100.0)
         if hum != 0.0:
-            power += 10 ** ((base + hum) / 10.0) - 10 ** (base / 10.0)
-        for f, bw, p in self.band_interference:
-            half = (bw + self.bandwidth) / 2.0
-            diff = abs(self.frequency_hz - f)
-            if diff <= half:
-                att = self._filter_attenuation_db(diff)
-                power += 10 ** ((p - att) / 10.0)
-            elif self.adjacent_interference_dB > 0 and diff <= half + self.bandwidth:
-                val = max(p - self.adjacent_interference_dB, 0.0) - self._filter_attenuation_db(diff)
-                power += 10 ** (val / 10.0)
+            # Le bruit d'humidité rehausse le plancher thermique de ``hum`` dB
+            power += base_mw * (10 ** (hum / 10.0) - 1.0)
+        if self._band_interference:
+            power += self._band_interference_mW()
+        rng = self.rng
         if self.noise_floor_std > 0:
-            power *= 10 ** (self.rng.normal(0.0, self.noise_floor_std) / 10.0)
+            power *= 10 ** (rng.normal(0.0, self.noise_floor_std) / 10.0)
         if self.impulsive_noise_prob > 0.0:
             val = self._impulse.sample()
-            if self.rng.random() < self.impulsive_noise_prob:
+            if rng.random() < self.impulsive_noise_prob:
                 power += 10 ** (val / 10.0)
         noise = 10 * math.log10(power)
         self.last_noise_dBm = noise
         return noise
 
+    @property
+    def band_interference(self) -> list[tuple[float, float, float]]:
+        """Brouilleurs ``(freq, bw, dB)`` ; entrées figées en tuples."""
+        return self._band_interference
+
+    @band_interference.setter
+    def band_interference(self, entries) -> None:
+        self._band_interference = _BandInterference(entries or ())
+
+    def _band_interference_dB(self) -> float:
+        """Somme (dB) des brouilleurs de ``band_interference`` sur ce canal.
+
+        La somme ne dépend que de la configuration : elle est mémorisée tant
+        que la liste des brouilleurs, la fréquence, la bande et la réjection
+        du canal adjacent ne changent pas.
+        """
+        entries = self._band_interference
+        key = (
+            entries,
+            entries.version,
+            self.frequency_hz,
+            self.bandwidth,
+            self.adjacent_interference_dB,
+        )
+        if key != self._band_db_key:
+            freq, bandwidth, adjacent_dB = key[2:]
+            total = 0.0
+            for f, bw, power in entries:
+                half = (bw + bandwidth) / 2.0
+                diff = abs(freq - f)
+                if diff <= half:
+                    total += power
+                elif adjacent_dB > 0 and diff <= half + bandwidth:
+                    total += max(power - adjacent_dB, 0.0)
+            self._band_db_key = key
+            self._band_db = total
+        return self._band_db
+
+    def _band_interference_mW(self) -> float:
+        """Puissance (mW) des brouilleurs après le filtre d'entrée.
+
+        Mémorisée comme :meth:`_band_interference_dB`, la clé incluant aussi
+        l'ordre et la largeur du filtre.
+        """
+        entries = self._band_interference
+        key = (
+            entries,
+            entries.version,
+            self.frequency_hz,
+            self.bandwidth,
+            self.adjacent_interference_dB,
+            self.frontend_filter_order,
+            self.frontend_filter_bw,
+        )
+        if key != self._band_mw_key:
+            freq, bandwidth, adjacent_dB = key[2:5]
+            total = 0.0
+            for f, bw, p in entries:
+                half = (bw + bandwidth) / 2.0
+                diff = abs(freq - f)
+                if diff <= half:
+                    att = self._filter_attenuation_db(diff)
+                    total += 10 ** ((p - att) / 10.0)
+                elif adjacent_dB > 0 and diff <= half + bandwidth:
+                    val = max(p - adjacent_dB, 0.0) - self._filter_attenuation_db(diff)
+                    total += 10 ** (val / 10.0)
+            self._band_mw_key = key
+            self._band_mw = total
+        return self._band_mw
+
     def path_loss(self, distance: float) -> float:
         """Calcule la perte de parcours (en dB) pour une distance donnée (m)."""
         if self.omnet_phy:
             return self.omnet_phy.path_loss(distance)
-        if getattr(self, "flora_phy", None):
+        if self.flora_phy:
             return self.flora_phy.path_loss(distance)
         if distance <= 0:
             return 0.0
@@ -503,9 +757,11 @@ class Channel:
                 freq_offset_hz=freq_offset_hz,
                 sync_offset_s=sync_offset_s,
             )
+        normal = self.rng.normal
+        omnet = self.omnet
         loss = self.path_loss(distance)
-        if self.shadowing_std > 0 and not getattr(self, "flora_phy", None):
-            loss += self.rng.normal(0, self.shadowing_std)
+        if self.shadowing_std > 0 and not self.flora_phy:
+            loss += normal(0, self.shadowing_std)
 
         tx_power_dBm += self._pa_nl.sample()
         # RSSI = P_tx + gains antennes - pertes - pertes câble
@@ -517,69 +773,56 @@ class Channel:
             - self.cable_loss_dB
         )
         if self.tx_power_std > 0:
-            rssi += self.rng.normal(0, self.tx_power_std)
+            rssi += normal(0, self.tx_power_std)
         if self.fast_fading_std > 0:
-            rssi += self.rng.normal(0, self.fast_fading_std)
+            rssi += normal(0, self.fast_fading_std)
         if self.multipath_taps > 1:
             rssi += self._multipath_fading_db()
         if self.time_variation_std > 0:
-            rssi += self.rng.normal(0, self.time_variation_std)
-        rssi += self.omnet.fine_fading()
+            rssi += normal(0, self.time_variation_std)
+        rssi += omnet.fine_fading()
         if (
             tx_angle is not None
             and rx_angle is not None
             and tx_pos is not None
             and rx_pos is not None
         ):
-            def _vec(pos1, pos2):
-                dx = (pos2[0] - pos1[0])
-                dy = (pos2[1] - pos1[1])
-                dz1 = pos1[2] if len(pos1) >= 3 else 0.0
-                dz2 = pos2[2] if len(pos2) >= 3 else 0.0
-                dz = dz2 - dz1
-                return dx, dy, dz
-
-            dx, dy, dz = _vec(tx_pos, rx_pos)
+            dx = rx_pos[0] - tx_pos[0]
+            dy = rx_pos[1] - tx_pos[1]
+            dz = (rx_pos[2] if len(rx_pos) >= 3 else 0.0) - (
+                tx_pos[2] if len(tx_pos) >= 3 else 0.0
+            )
             dist = math.sqrt(dx * dx + dy * dy + dz * dz)
             if dist > 0.0:
-                los = (dx / dist, dy / dist, dz / dist)
-
-                def _orient_vec(angle):
-                    if isinstance(angle, (tuple, list)):
-                        az, el = angle
-                    else:
-                        az = angle
-                        el = 0.0
-                    return (
-                        math.cos(el) * math.cos(az),
-                        math.cos(el) * math.sin(az),
-                        math.sin(el),
-                    )
-
-                tx_vec = _orient_vec(tx_angle)
-                rx_vec = _orient_vec(rx_angle)
-                tx_dot = max(min(sum(a * b for a, b in zip(los, tx_vec)), 1.0), -1.0)
-                rx_dot = max(min(sum(-a * b for a, b in zip(los, rx_vec)), 1.0), -1.0)
+                lx = dx / dist
+                ly = dy / dist
+                lz = dz / dist
+                tx_x, tx_y, tx_z = _orientation_vector(tx_angle)
+                rx_x, rx_y, rx_z = _orientation_vector(rx_angle)
+                tx_dot = max(min(lx * tx_x + ly * tx_y + lz * tx_z, 1.0), -1.0)
+                rx_dot = max(min(-lx * rx_x - ly * rx_y - lz * rx_z, 1.0), -1.0)
                 tx_diff = math.acos(tx_dot)
                 rx_diff = math.acos(rx_dot)
-                rssi += self._directional_gain(tx_diff)
-                rssi += self._directional_gain(rx_diff)
+                directional_gain = self._directional_gain
+                rssi += directional_gain(tx_diff)
+                rssi += directional_gain(rx_diff)
         rssi += self.rssi_offset_dB
         if freq_offset_hz is None:
             freq_offset_hz = self.frequency_offset_hz
-        freq_offset_hz += self.omnet.frequency_drift()
+        freq_offset_hz += omnet.frequency_drift()
         if sync_offset_s is None:
             sync_offset_s = self.sync_offset_s
-        sync_offset_s += self.omnet.clock_drift()
+        sync_offset_s += omnet.clock_drift()
         if self.clock_jitter_std_s > 0.0:
-            sync_offset_s += self.rng.normal(0.0, self.clock_jitter_std_s)
+            sync_offset_s += normal(0.0, self.clock_jitter_std_s)
 
         attenuation = self._filter_attenuation_db(freq_offset_hz)
         rssi -= attenuation
 
-        if self.phy_model == "flora_full" and sf is not None:
+        phy_model = self.phy_model
+        if phy_model == "flora_full" and sf is not None:
             noise = self._flora_noise_dBm(sf)
-        elif self.phy_model == "omnet_full" and sf is not None:
+        elif phy_model == "omnet_full" and sf is not None:
             noise = self._omnet_noise_dBm(sf, freq_offset_hz)
         else:
             noise = self.noise_floor_dBm(freq_offset_hz)
@@ -588,24 +831,19 @@ class Channel:
         snr -= penalty
         snr -= abs(self._phase_noise.sample())
         if sf is not None:
-            snr += 10 * math.log10(2 ** sf)
+            snr += sf * _SF_GAIN_STEP_DB
         self.last_rssi_dBm = rssi
         self.last_filter_att_dB = attenuation
         return rssi, snr
 
     def packet_error_rate(self, snr: float, sf: int, payload_bytes: int = 20) -> float:
         """Return PER based on the OMNeT++ BER model."""
-        if getattr(self, "flora_phy", None) and self.use_flora_curves:
+        if self.flora_phy and self.use_flora_curves:
             return self.flora_phy.packet_error_rate(snr, sf, payload_bytes)
 
         from .omnet_modulation import calculate_ber
 
-        bitrate = (
-            sf
-            * self.bandwidth
-            * 4.0
-            / ((1 << sf) * (self.coding_rate + 4))
-        )
+        bitrate = self._bitrate(self.bandwidth, self.coding_rate, sf)
         snir = 10 ** (snr / 10.0)
         ber = calculate_ber(snir, self.bandwidth, bitrate)
         n_bits = payload_bytes * 8
@@ -616,24 +854,29 @@ class Channel:
         """Return a fading value in dB based on multiple Rayleigh paths."""
         if self.multipath_taps <= 1:
             return 0.0
-        i = sum(self.rng.normal(0.0, 1.0) for _ in range(self.multipath_taps))
-        q = sum(self.rng.normal(0.0, 1.0) for _ in range(self.multipath_taps))
-        amp = math.sqrt(i * i + q * q) / math.sqrt(self.multipath_taps)
-        return 20 * math.log10(max(amp, 1e-12))
+        taps = self.multipath_taps
+        draw = getattr(self.rng, "standard_normal", None)
+        if draw is not None:
+            # One block of 2*taps draws: same stream as the scalar calls below
+            block = draw(2 * taps).tolist()
+            i = sum(block[:taps])
+            q = sum(block[taps:])
+        else:
+            normal = self.rng.normal
+            i = sum(normal(0.0, 1.0) for _ in range(taps))
+            q = sum(normal(0.0, 1.0) for _ in range(taps))
+        return _rayleigh_paths_db(i, q, taps)
 
     def _filter_attenuation_db(self, freq_offset_hz: float) -> float:
         """Return attenuation due to the front-end filter."""
-        if self.frontend_filter_order <= 0 or self.frontend_filter_bw <= 0:
+        order = self.frontend_filter_order
+        filter_bw = self.frontend_filter_bw
+        if order <= 0 or filter_bw <= 0:
             return 0.0
-        fc = self.frontend_filter_bw / 2.0
+        fc = filter_bw / 2.0
         if fc <= 0.0:
             return 0.0
-        ratio = abs(freq_offset_hz) / fc
-        if ratio <= 0.0:
-            return 0.0
-        # |H(jw)|^2 = 1 / (1 + (w/wc)^(2n)) for an n-th order Butterworth filter
-        # Attenuation in dB is -10 log10(|H|^2) = 10 log10(1 + ratio^(2n))
-        return 10 * math.log10(1.0 + ratio ** (2 * self.frontend_filter_order))
+        return _butterworth_attenuation_db(freq_offset_hz, fc, order)
 
     def _alignment_penalty_db(
         self, freq_offset_hz: float, sync_offset_s: float, sf: int | None
@@ -642,31 +885,61 @@ class Channel:
         bw = self.bandwidth
         freq_factor = abs(freq_offset_hz) / (bw / 2.0)
         if sf is not None:
-            symbol_time = (2 ** sf) / bw
+            symbol_time = (1 << sf) / bw
         else:
             symbol_time = 1.0 / bw
         time_factor = abs(sync_offset_s) / symbol_time
         if freq_factor >= 1.0 and time_factor >= 1.0:
             return float("inf")
-        penalty = 1.5 * (freq_factor ** 2 + time_factor ** 2)
-        return 10 * math.log10(1.0 + penalty)
+        penalty = 1.5 * (freq_factor * freq_factor + time_factor * time_factor)
+        return _TEN_OVER_LN10 * math.log1p(penalty)
 
     def _directional_gain(self, angle_rad: float) -> float:
         """Simple cosine-squared antenna pattern."""
-        gain = max(math.cos(angle_rad), 0.0) ** 2
-        return 10 * math.log10(max(gain, 1e-3))
+        c = math.cos(angle_rad)
+        gain = c * c
+        # Back lobe and deep side lobes share the clamped floor
+        if c <= 0.0 or gain <= 1e-3:
+            return _GAIN_FLOOR_DB
+        return _TEN_OVER_LN10 * math.log(gain)
 
     def airtime(self, sf: int, payload_size: int = 20) -> float:
         """Calcule l'airtime complet d'un paquet LoRa en secondes."""
+        return self._airtime(
+            self.bandwidth,
+            self.coding_rate,
+            self.preamble_symbols,
+            self.low_data_rate_threshold,
+            sf,
+            payload_size,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _bitrate(bandwidth: float, coding_rate: int, sf: int) -> float:
+        """Débit binaire (bit/s) mémorisé pour la bande, le CR et le SF."""
+        return sf * bandwidth * 4.0 / ((1 << sf) * (coding_rate + 4))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _airtime(
+        bandwidth: float,
+        coding_rate: int,
+        preamble_symbols: int,
+        low_data_rate_threshold: int,
+        sf: int,
+        payload_size: int,
+    ) -> float:
+        """Airtime mémorisé, fonction pure des paramètres de modulation."""
         # Durée d'un symbole
-        rs = self.bandwidth / (2 ** sf)
+        rs = bandwidth / (2 ** sf)
         ts = 1.0 / rs
-        de = 1 if sf >= self.low_data_rate_threshold else 0
-        cr_denom = self.coding_rate + 4
+        de = 1 if sf >= low_data_rate_threshold else 0
+        cr_denom = coding_rate + 4
         numerator = 8 * payload_size - 4 * sf + 28 + 16 - 20 * 0
         denominator = 4 * (sf - 2 * de)
         n_payload = max(math.ceil(numerator / denominator), 0) * cr_denom + 8
-        t_preamble = (self.preamble_symbols + 4.25) * ts
+        t_preamble = (preamble_symbols + 4.25) * ts
         t_payload = n_payload * ts
         return t_preamble + t_payload
 
@@ -677,12 +950,13 @@ class Channel:
     @classmethod
     def register_region(cls, name: str, frequencies: list[float]) -> None:
         """Register a new region frequency plan."""
-        cls.REGION_CHANNELS[name.upper()] = list(frequencies)
+        cls.REGION_CHANNELS[sys.intern(name.upper())] = list(frequencies)
 
     @classmethod
     def region_channels(cls, region: str, **kwargs) -> list["Channel"]:
         """Return a list of ``Channel`` objects for the given region preset."""
-        reg = region.upper()
+        # Nom normalisé une fois puis partagé par tous les canaux du plan
+        reg = sys.intern(region.upper())
         if reg not in cls.REGION_CHANNELS:
             raise ValueError(f"Unknown region preset: {region}")
         return [cls(frequency_hz=f, region=reg, channel_index=i, **kwargs)
@@ -704,10 +978,17 @@ class Channel:
         delta = self.noise_floor_dBm(freq_offset_hz) - thermal
         return base + delta
 
-
-    def _update_sensitivity(self) -> None:
+    @functools.cached_property
+    def sensitivity_dBm(self) -> dict[int, float]:
+        """Sensibilité (dBm) par SF, calculée au premier accès."""
         bw = min(self.bandwidth, self.frontend_filter_bw)
         noise = -174 + 10 * math.log10(bw) + self.noise_figure_dB
-        self.sensitivity_dBm = {
-            sf: noise + snr for sf, snr in self.SNR_THRESHOLDS.items()
-        }
+        return {sf: noise + snr for sf, snr in self.SNR_THRESHOLDS.items()}
+
+    def _update_sensitivity(self) -> None:
+        """Invalide la table de sensibilité.
+
+        À appeler après un changement de bande, de filtre ou de facteur de
+        bruit : ``sensitivity_dBm`` est recalculée au prochain accès.
+        """
+        self.__dict__.pop("sensitivity_dBm", None)
@@ -1,4 +1,5 @@
 import argparse
+import csv
 import os
 
 try:
@@ -6,8 +7,60 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     pd = None
 
-
-def clean_csv(input_path: str, output_path: str | None = None) -> str:
+# Cells that ``pandas.read_csv`` treats as missing by default
+_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+# 1 MiB I/O buffers: result files are read and written in large blocks
+_IO_BUFFER = 1 << 20
+
+
+def _event_sort_key(rows: list[list[str]], col: int):
+    """Return a sort key ordering ``rows`` numerically by column ``col``."""
+    try:
+        keys = {row[col]: float(row[col]) for row in rows}
+    except ValueError:
+        return lambda row: row[col]
+    return lambda row: keys[row[col]]
+
+
+def _clean_csv_stream(input_path: str, cleaned_path: str) -> None:
+    """Clean ``input_path`` into ``cleaned_path`` with the :mod:`csv` module."""
+    with open(input_path, newline="", buffering=_IO_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"{input_path} has no header row")
+        width = len(header)
+        seen: set[tuple[str, ...]] = set()
+        rows: list[list[str]] = []
+        for row in reader:
+            # Short rows and blank lines count as missing values
+            if len(row) != width or any(v in _NA_VALUES for v in row):
+                continue
+            key = tuple(row)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append(row)
+
+    if "event_id" in header:
+        rows.sort(key=_event_sort_key(rows, header.index("event_id")))
+
+    with open(cleaned_path, "w", newline="", buffering=_IO_BUFFER) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def clean_csv(
+    input_path: str,
+    output_path: str | None = None,
+    *,
+    use_pandas: bool | None = None,
+) -> str:
     """Load CSV file, clean it and save to new file.
 
     Parameters
@@ -17,33 +70,42 @@ def clean_csv(input_path: str, output_path: str | None = None) -> str:
     output_path : str | None
         Destination path for cleaned CSV. If None, ``input_path`` is used with
         ``_clean`` suffix.
+    use_pandas : bool | None
+        Clean through a :class:`pandas.DataFrame`, whose cells are parsed
+        (``1.0`` and ``1`` are duplicates) and re-formatted on output.  With
+        ``False`` the rows are streamed with the :mod:`csv` module and written
+        back verbatim.  ``None`` (default) uses pandas when it is installed
+        and falls back to the :mod:`csv` module otherwise.
 
     Returns
     -------
     str
         Path to the cleaned CSV file on disk.
     """
+    cleaned_path = (
+        output_path if output_path is not None else os.path.splitext(input_path)[0] + "_clean.csv"
+    )
+    if use_pandas is None:
+        use_pandas = pd is not None
+    if not use_pandas:
+        _clean_csv_stream(input_path, cleaned_path)
+        return cleaned_path
+
     if pd is None:
         raise RuntimeError("pandas is required to clean CSV files")
 
-    df = pd.read_csv(input_path)
-
-    # Drop exact duplicate rows
-    df = df.drop_duplicates()
+    df = pd.read_csv(input_path, engine="c", low_memory=False)
 
-    # Remove rows with any missing values
-    df = df.dropna(how="any")
+    # Drop exact duplicate rows and rows with any missing values in place;
+    # both keep the original row order so no ``sort_index`` is needed after.
+    df.drop_duplicates(inplace=True)
+    df.dropna(how="any", inplace=True)
 
     # If an ``event_id`` column exists, sort by it for consistency
     if "event_id" in df.columns:
-        df = df.sort_values(by="event_id")
-    else:
-        df = df.sort_index()
+        df.sort_values(by="event_id", inplace=True, kind="mergesort")
 
-    cleaned_path = (
-        output_path if output_path is not None else os.path.splitext(input_path)[0] + "_clean.csv"
-    )
-    df.to_csv(cleaned_path, index=False)
+    df.to_csv(cleaned_path, index=False, chunksize=100_000)
 
     return cleaned_path
 
@@ -56,9 +118,16 @@ def main() -> None:
         "-o",
         help="Chemin du fichier nettoyé (par défaut <csv_file>_clean.csv)",
     )
+    parser.add_argument(
+        "--no-pandas",
+        dest="use_pandas",
+        action="store_const",
+        const=False,
+        help="Nettoie en flux avec le module csv même si pandas est installé",
+    )
     args = parser.parse_args()
 
-    cleaned = clean_csv(args.csv_file, args.output)
+    cleaned = clean_csv(args.csv_file, args.output, use_pandas=args.use_pandas)
     print(f"Fichier nettoyé enregistré dans {cleaned}")
 
 
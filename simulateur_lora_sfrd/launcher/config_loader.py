@@ -3,6 +3,114 @@ import json
 import re
 from pathlib import Path
 
+try:  # orjson is optional and only speeds up JSON scenario loading
+    import orjson
+except Exception:  # pragma: no cover - orjson may not be installed
+    orjson = None
+
+_NEXT_PATTERN = r"timeToNextPacket\s*=\s*exponential\((\d+(?:\.\d+)?)s\)"
+_FIRST_PATTERN = r"timeToFirstPacket\s*=\s*exponential\((\d+(?:\.\d+)?)s\)"
+# Bytes patterns: the interval helpers scan the raw file without decoding it
+_NEXT_RE_B = re.compile(_NEXT_PATTERN.encode("ascii"))
+_FIRST_RE_B = re.compile(_FIRST_PATTERN.encode("ascii"))
+# Both parameters in one alternation so that ``load_config`` finds them in a
+# single scan of the INI text.
+_INTERVAL_RE = re.compile(f"{_NEXT_PATTERN}|{_FIRST_PATTERN}", re.ASCII)
+
+
+def load_json(path: str | Path):
+    """Parse the JSON document at ``path`` straight from its raw bytes.
+
+    Uses :mod:`orjson` when installed and falls back to :mod:`json` for the
+    documents it rejects, such as ``NaN`` or ``Infinity`` values.
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _parse_intervals(text: str) -> tuple[float | None, float | None]:
+    """Return ``(next, first)`` mean intervals found in FLoRa INI ``text``.
+
+    Mirrors :func:`parse_flora_interval` and
+    :func:`parse_flora_first_interval` without re-reading the file.
+    """
+
+    next_val = None
+    first_val = None
+    for match in _INTERVAL_RE.finditer(text):
+        next_str, first_str = match.groups()
+        if next_str is not None:
+            next_val = float(next_str)
+            break
+        if first_val is None:
+            first_val = float(first_str)
+    if next_val is not None:
+        return next_val, next_val
+    return None, first_val
+
+
+_POSITION_SECTIONS = ("gateways", "nodes")
+
+
+def _parse_flora_sections(text: str) -> dict[str, list[str]] | None:
+    """Return the raw ``[gateways]`` and ``[nodes]`` values of an INI ``text``.
+
+    Single-pass reader for the restricted ``key = x,y[,sf,tx_power]`` grammar
+    produced by :func:`write_flora_ini`; the other sections are skipped.
+    ``None`` is returned on anything it does not handle exactly like
+    :class:`configparser.ConfigParser` (continuation lines, interpolation,
+    ``[DEFAULT]``, duplicate keys or sections, malformed lines) so that the
+    caller can fall back to it.
+    """
+
+    sections: dict[str, list[str]] = {}
+    seen_headers: set[str] = set()
+    values: list[str] | None = None
+    keys: set[str] = set()
+    in_section = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if line[0] in " \t" and (values is not None or stripped[0] == "["):
+            return None
+        if stripped[0] == "[" and "]" in stripped:
+            header = stripped[1:stripped.rindex("]")]
+            if not header or header == "DEFAULT" or header in seen_headers:
+                return None
+            seen_headers.add(header)
+            in_section = True
+            if header in _POSITION_SECTIONS:
+                values = sections[header] = []
+                keys = set()
+            else:
+                values = None
+            continue
+        if not in_section:
+            return None
+        if values is None:
+            continue
+        if "%" in stripped:
+            return None
+        eq = stripped.find("=")
+        colon = stripped.find(":")
+        if eq < 0 or 0 <= colon < eq:
+            eq = colon
+        if eq < 0:
+            return None
+        key = stripped[:eq].rstrip().lower()
+        if key in keys:
+            return None
+        keys.add(key)
+        values.append(stripped[eq + 1:].strip())
+    return sections
+
+
 def load_config(
     path: str | Path,
 ) -> tuple[list[dict], list[dict], float | None, float | None]:
@@ -29,7 +137,7 @@ def load_config(
     first_interval = None
 
     if path.suffix.lower() == ".json":
-        data = json.loads(path.read_text())
+        data = load_json(path)
         for gw in data.get("gateways", []):
             gateways.append({
                 "x": float(gw.get("x", 0)),
@@ -44,34 +152,41 @@ def load_config(
             })
         return nodes, gateways, next_interval, first_interval
 
-    cp = configparser.ConfigParser()
-    cp.read(path)
+    text = path.read_text()
+    sections = _parse_flora_sections(text)
+    if sections is None:
+        cp = configparser.ConfigParser()
+        cp.read_string(text, source=str(path))
+        sections = {
+            name: [value for _, value in cp.items(name)]
+            for name in _POSITION_SECTIONS
+            if cp.has_section(name)
+        }
 
-    if cp.has_section("gateways"):
-        for _, value in cp.items("gateways"):
-            parts = [p.strip() for p in value.split(",")]
-            if len(parts) < 2:
-                continue
-            gateways.append({
-                "x": float(parts[0]),
-                "y": float(parts[1]),
-            })
+    # float() and int() ignore surrounding whitespace, so the fields are
+    # converted straight from ``split`` without a per-field ``strip``.
+    for value in sections.get("gateways", ()):
+        parts = value.split(",")
+        if len(parts) < 2:
+            continue
+        gateways.append({
+            "x": float(parts[0]),
+            "y": float(parts[1]),
+        })
 
-    if cp.has_section("nodes"):
-        for _, value in cp.items("nodes"):
-            parts = [p.strip() for p in value.split(",")]
-            if len(parts) < 2:
-                continue
-            node = {
-                "x": float(parts[0]),
-                "y": float(parts[1]),
-                "sf": int(parts[2]) if len(parts) > 2 else 7,
-                "tx_power": float(parts[3]) if len(parts) > 3 else 14.0,
-            }
-            nodes.append(node)
-
-    next_interval = parse_flora_interval(path)
-    first_interval = parse_flora_first_interval(path)
+    for value in sections.get("nodes", ()):
+        parts = value.split(",")
+        n_parts = len(parts)
+        if n_parts < 2:
+            continue
+        nodes.append({
+            "x": float(parts[0]),
+            "y": float(parts[1]),
+            "sf": int(parts[2]) if n_parts > 2 else 7,
+            "tx_power": float(parts[3]) if n_parts > 3 else 14.0,
+        })
+
+    next_interval, first_interval = _parse_intervals(text)
 
     return nodes, gateways, next_interval, first_interval
 
@@ -128,8 +243,8 @@ def parse_flora_interval(path: str | Path) -> float | None:
     returned when the parameter cannot be found.
     """
 
-    text = Path(path).read_text()
-    match = re.search(r"timeToNextPacket\s*=\s*exponential\((\d+(?:\.\d+)?)s\)", text)
+    data = Path(path).read_bytes()
+    match = _NEXT_RE_B.search(data)
     if match:
         return float(match.group(1))
     return None
@@ -144,12 +259,8 @@ def parse_flora_first_interval(path: str | Path) -> float | None:
     the subsequent ones.
     """
 
-    next_val = parse_flora_interval(path)
-    if next_val is not None:
-        return next_val
-
-    text = Path(path).read_text()
-    match = re.search(r"timeToFirstPacket\s*=\s*exponential\((\d+(?:\.\d+)?)s\)", text)
+    data = Path(path).read_bytes()
+    match = _NEXT_RE_B.search(data) or _FIRST_RE_B.search(data)
     if match:
         return float(match.group(1))
     return None
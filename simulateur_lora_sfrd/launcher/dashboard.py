@@ -292,13 +292,21 @@ def update_map():
     pixel_to_unit = display_area_y / 600
     node_offset = 16 * pixel_to_unit
     gw_offset = 14 * pixel_to_unit
+    # Un seul parcours des nœuds : coordonnées, étiquettes et trajectoires
+    x_nodes = []
+    y_nodes = []
+    node_ids = []
+    nodes_by_id = {}
     for node in sim.nodes:
-        node_paths.setdefault(node.id, []).append((node.x, node.y))
-        if len(node_paths[node.id]) > 50:
-            node_paths[node.id] = node_paths[node.id][-50:]
-    x_nodes = [node.x for node in sim.nodes]
-    y_nodes = [node.y for node in sim.nodes]
-    node_ids = [str(node.id) for node in sim.nodes]
+        x, y, nid = node.x, node.y, node.id
+        x_nodes.append(x)
+        y_nodes.append(y)
+        node_ids.append(str(nid))
+        nodes_by_id.setdefault(nid, node)
+        path = node_paths.setdefault(nid, [])
+        path.append((x, y))
+        if len(path) > 50:
+            del path[:-50]
     fig.add_scatter(
         x=x_nodes,
         y=y_nodes,
@@ -309,6 +317,9 @@ def update_map():
         marker=dict(symbol="circle", color="blue", size=32),
         textfont=dict(color="white", size=14),
     )
+    gateways_by_id = {}
+    for gw in sim.gateways:
+        gateways_by_id.setdefault(gw.id, gw)
     x_gw = [gw.x for gw in sim.gateways]
     y_gw = [gw.y for gw in sim.gateways]
     gw_ids = [str(gw.id) for gw in sim.gateways]
@@ -334,8 +345,8 @@ def update_map():
         gw_id = ev.get("gateway_id")
         if gw_id is None:
             continue
-        node = next((n for n in sim.nodes if n.id == ev["node_id"]), None)
-        gw = next((g for g in sim.gateways if g.id == gw_id), None)
+        node = nodes_by_id.get(ev["node_id"])
+        gw = gateways_by_id.get(gw_id)
         if not node or not gw:
             continue
         color = "green" if ev.get("result") == "Success" else "red"
@@ -453,16 +464,20 @@ def update_heatmap(event=None):
     res = int(heatmap_res_slider.value)
     xs = np.linspace(0, area, res)
     ys = np.linspace(0, area, res)
-    z = np.zeros((res, res))
-    for i, y in enumerate(ys):
-        for j, x in enumerate(xs):
-            best_rssi = -float("inf")
-            for gw in sim.gateways:
-                d = math.hypot(x - gw.x, y - gw.y)
-                rssi, _ = sim.channel.compute_rssi(14.0, d, sf=7)
-                if rssi > best_rssi:
-                    best_rssi = rssi
-            z[i, j] = best_rssi
+    gateways = sim.gateways
+    if gateways:
+        gx = np.array([gw.x for gw in gateways])
+        gy = np.array([gw.y for gw in gateways])
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        # Distances (ligne, colonne, passerelle) aplaties dans l'ordre des
+        # anciennes boucles : les tirages aléatoires du canal sont consommés
+        # dans le même ordre.
+        dist = np.hypot(grid_x[..., None] - gx, grid_y[..., None] - gy).ravel().tolist()
+        compute = sim.channel.compute_rssi
+        rssi = [compute(14.0, d, sf=7)[0] for d in dist]
+        z = np.asarray(rssi).reshape(res, res, len(gateways)).max(axis=-1)
+    else:
+        z = np.full((res, res), -np.inf)
     fig = go.Figure()
     fig.add_trace(go.Heatmap(x=xs, y=ys, z=z, colorscale="Viridis"))
     fig.add_scatter(
@@ -47,6 +47,22 @@ class FloraCppPHY:
         self.lib.flora_capture.restype = ctypes.c_int
         self.lib.flora_per.argtypes = [ctypes.c_double, ctypes.c_int, ctypes.c_int]
         self.lib.flora_per.restype = ctypes.c_double
+        # Buffers passed to ``flora_capture`` are kept across calls and only
+        # reallocated when a larger batch is requested.
+        self._capacity = 0
+        self._ensure_capacity(16)
+
+    def _ensure_capacity(self, length: int) -> None:
+        if length <= self._capacity:
+            return
+        capacity = max(length, 2 * self._capacity)
+        arr_type_d = ctypes.c_double * capacity
+        self._rssi_buf = arr_type_d()
+        self._sf_buf = (ctypes.c_int * capacity)()
+        self._start_buf = arr_type_d()
+        self._end_buf = arr_type_d()
+        self._freq_buf = arr_type_d()
+        self._capacity = capacity
 
     def path_loss(self, distance: float) -> float:
         return float(self.lib.flora_path_loss(ctypes.c_double(distance)))
@@ -60,14 +76,18 @@ class FloraCppPHY:
         freq_list: list[float],
     ) -> list[bool]:
         length = len(rssi_list)
-        arr_type_d = ctypes.c_double * length
-        arr_type_i = ctypes.c_int * length
+        self._ensure_capacity(length)
+        self._rssi_buf[:length] = rssi_list
+        self._sf_buf[:length] = sf_list
+        self._start_buf[:length] = start_list
+        self._end_buf[:length] = end_list
+        self._freq_buf[:length] = freq_list
         res = self.lib.flora_capture(
-            arr_type_d(*rssi_list),
-            arr_type_i(*sf_list),
-            arr_type_d(*start_list),
-            arr_type_d(*end_list),
-            arr_type_d(*freq_list),
+            self._rssi_buf,
+            self._sf_buf,
+            self._start_buf,
+            self._end_buf,
+            self._freq_buf,
             ctypes.c_size_t(length),
         )
         winners = [False] * length
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 from typing import Iterable, Union, List, Any
 
+from .config_loader import load_json
+
 
 def _parse(value: Any) -> Any:
     try:
@@ -19,10 +20,10 @@ def load_map(source: Union[str, Path, Iterable[Iterable[Any]]]) -> List[List[Any
     """
     if isinstance(source, (str, Path)):
         path = Path(source)
-        text = path.read_text()
         if path.suffix.lower() == ".json":
-            data = json.loads(text)
+            data = load_json(path)
         else:
+            text = path.read_text()
             lines = [line.strip() for line in text.splitlines() if line.strip()]
             data = [
                 [_parse(v) for v in line.replace(",", " ").split()]
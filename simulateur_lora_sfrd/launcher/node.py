@@ -915,17 +915,20 @@ class Node:
 
     def _check_adr_ack_delay(self) -> None:
         """Reduce data rate when ADR_ACK_DELAY has elapsed with no downlink."""
-        from .lorawan import TX_POWER_INDEX_TO_DBM, DBM_TO_TX_POWER_INDEX
+        # Called on every uplink: bail out before touching the import system
+        # in the common case where the backoff threshold is not reached.
+        if self.adr_ack_cnt < self.adr_ack_limit + self.adr_ack_delay:
+            return
+        if self.sf < 12:
+            self.sf += 1
+        else:
+            from .lorawan import TX_POWER_INDEX_TO_DBM, DBM_TO_TX_POWER_INDEX
 
-        if self.adr_ack_cnt >= self.adr_ack_limit + self.adr_ack_delay:
-            if self.sf < 12:
-                self.sf += 1
-            else:
-                idx = DBM_TO_TX_POWER_INDEX.get(int(self.tx_power), 0)
-                if idx > 0:
-                    idx -= 1
-                    self.tx_power = TX_POWER_INDEX_TO_DBM[idx]
-            self.adr_ack_cnt = 0
+            idx = DBM_TO_TX_POWER_INDEX.get(int(self.tx_power), 0)
+            if idx > 0:
+                idx -= 1
+                self.tx_power = TX_POWER_INDEX_TO_DBM[idx]
+        self.adr_ack_cnt = 0
 
     def schedule_receive_windows(self, end_time: float):
         """Return RX1 and RX2 times for the last uplink."""
@@ -62,10 +62,15 @@ class OmnetModel:
         self._clock = self.correlation * self._clock + (1 - self.correlation) * gaussian
         return self._clock
 
-    def thermal_noise_dBm(self, bandwidth: float) -> float:
-        """Return the thermal noise level for the given bandwidth."""
+    def thermal_noise_dBm(self, bandwidth: float, temperature_K: float | None = None) -> float:
+        """Return the thermal noise level for the given bandwidth.
+
+        ``temperature_K`` overrides the model temperature for this call only.
+        """
+        if temperature_K is None:
+            temperature_K = self.temperature_K
         k = 1.38064852e-23
-        noise_w = k * self.temperature_K * bandwidth
+        noise_w = k * temperature_K * bandwidth
         return 10 * math.log10(noise_w) + 30
 
     def variable_thermal_noise_dBm(self, bandwidth: float) -> float:
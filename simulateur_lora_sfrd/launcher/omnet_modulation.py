@@ -4,27 +4,32 @@ from __future__ import annotations
 
 import math
 
+# Terms of the alternating sum in LoRaModulation::calculateBER, as
+# (C(16, k), 1/k - 1, 1/(16 - k) - 1) for the paired values of k
+_BER_ADD_PAIRS = tuple(
+    (math.comb(16, k), 1.0 / k - 1.0, 1.0 / (16 - k) - 1.0) for k in range(2, 8, 2)
+)
+_BER_SUB_PAIRS = tuple(
+    (math.comb(16, k), 1.0 / k - 1.0, 1.0 / (16 - k) - 1.0) for k in range(3, 8, 2)
+)
+_BER_C8 = math.comb(16, 8)
+_BER_E8 = 1.0 / 8 - 1.0
+_BER_C15 = math.comb(16, 15)
+_BER_E15 = 1.0 / 15 - 1.0
+_BER_E16 = 1.0 / 16 - 1.0
+
 
 def calculate_ber(snir: float, bandwidth: float, bitrate: float) -> float:
     """Return BER using the formula from LoRaModulation::calculateBER."""
     dsnr = 20.0 * snir * bandwidth / bitrate
     dsumk = 0.0
-    for k in range(2, 8, 2):
-        comb = math.comb(16, k)
-        dsumk += comb * (
-            math.exp(dsnr * (1.0 / k - 1.0))
-            + math.exp(dsnr * (1.0 / (16 - k) - 1.0))
-        )
-    k = 8
-    dsumk += math.comb(16, k) * math.exp(dsnr * (1.0 / k - 1.0))
-    for k in range(3, 8, 2):
-        comb = math.comb(16, k)
-        dsumk -= comb * (
-            math.exp(dsnr * (1.0 / k - 1.0))
-            + math.exp(dsnr * (1.0 / (16 - k) - 1.0))
-        )
-    dsumk -= math.comb(16, 15) * math.exp(dsnr * (1.0 / 15 - 1.0))
-    dsumk += math.comb(16, 16) * math.exp(dsnr * (1.0 / 16 - 1.0))
+    for comb, e1, e2 in _BER_ADD_PAIRS:
+        dsumk += comb * (math.exp(dsnr * e1) + math.exp(dsnr * e2))
+    dsumk += _BER_C8 * math.exp(dsnr * _BER_E8)
+    for comb, e1, e2 in _BER_SUB_PAIRS:
+        dsumk -= comb * (math.exp(dsnr * e1) + math.exp(dsnr * e2))
+    dsumk -= _BER_C15 * math.exp(dsnr * _BER_E15)
+    dsumk += math.exp(dsnr * _BER_E16)
     return (8.0 / 15.0) * (1.0 / 16.0) * dsumk
 
 
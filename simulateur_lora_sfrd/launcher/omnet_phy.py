@@ -5,6 +5,7 @@ from __future__ import annotations
 import math
 import random
 
+from .channel import _SF_GAIN_STEP_DB
 from .omnet_model import OmnetModel
 
 
@@ -261,13 +262,8 @@ class OmnetPHY:
         noise = thermal + ch.noise_figure_dB + ch.interference_dB
         if ch.humidity_noise_coeff_dB != 0.0:
             noise += ch.humidity_noise_coeff_dB * (ch._humidity.sample() / 100.0)
-        for f, bw, power in ch.band_interference:
-            half = (bw + ch.bandwidth) / 2.0
-            diff = abs(ch.frequency_hz - f)
-            if diff <= half:
-                noise += power
-            elif ch.adjacent_interference_dB > 0 and diff <= half + ch.bandwidth:
-                noise += max(power - ch.adjacent_interference_dB, 0.0)
+        if ch._band_interference:
+            noise += ch._band_interference_dB()
         if ch.noise_floor_std > 0:
             noise += random.gauss(0.0, ch.noise_floor_std)
         if ch.impulsive_noise_prob > 0.0 and random.random() < ch.impulsive_noise_prob:
@@ -334,7 +330,7 @@ class OmnetPHY:
         snr -= abs(self._phase_noise.sample())
         snr -= abs(self._rx_fault.sample())
         if sf is not None:
-            snr += 10 * math.log10(2 ** sf)
+            snr += sf * _SF_GAIN_STEP_DB
         return rssi, snr
 
     def _alignment_penalty_db(
@@ -344,7 +340,7 @@ class OmnetPHY:
         bw = self.channel.bandwidth
         freq_factor = abs(freq_offset_hz) / (bw / 2.0)
         if sf is not None:
-            symbol_time = (2 ** sf) / bw
+            symbol_time = (1 << sf) / bw
         else:
             symbol_time = 1.0 / bw
         time_factor = abs(sync_offset_s) / symbol_time
@@ -13,3 +13,61 @@ if ROOT_DIR not in sys.path:
 @pytest.fixture(autouse=True)
 def _set_seed():
     random.seed(1)
+
+
+class _Block(list):
+    """List standing in for a NumPy array: callers only use ``tolist``."""
+
+    def tolist(self):
+        return list(self)
+
+
+class _ScalarRng:
+    """Seeded stand-in for a NumPy generator offering scalar draws only."""
+
+    def __init__(self, seed, scalar_draws=True):
+        self._r = random.Random(seed)
+        self.scalar_draws = scalar_draws
+        self.calls = 0
+
+    def _scalar(self):
+        assert self.scalar_draws, "scalar draw used with pooling enabled"
+
+    def normal(self, loc=0.0, scale=1.0):
+        self._scalar()
+        return self._r.gauss(loc, scale)
+
+    def gamma(self, shape, scale):
+        self._scalar()
+        return self._r.gammavariate(shape, scale)
+
+
+class _BlockRng(_ScalarRng):
+    """:class:`_ScalarRng` that also draws arrays, counting each block."""
+
+    def standard_normal(self, size):
+        self.calls += 1
+        return _Block(self._r.gauss(0.0, 1.0) for _ in range(size))
+
+    def gamma(self, shape, scale, size=None):
+        if size is None:
+            return super().gamma(shape, scale)
+        self.calls += 1
+        return _Block(self._r.gammavariate(shape, scale) for _ in range(size))
+
+
+@pytest.fixture
+def fake_rng():
+    """Factory ``fake_rng(seed, blocks=True, scalar_draws=True)`` of fake generators.
+
+    Block and scalar draws come from one :class:`random.Random` stream seeded
+    with ``seed``, so pooled and scalar consumers see the same values.
+    ``blocks=False`` leaves out the array draws (like the bundled NumPy stub)
+    and ``scalar_draws=False`` makes any scalar draw fail.
+    """
+
+    def make(seed=0, *, blocks=True, scalar_draws=True):
+        cls = _BlockRng if blocks else _ScalarRng
+        return cls(seed, scalar_draws)
+
+    return make
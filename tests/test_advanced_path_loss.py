@@ -0,0 +1,16 @@
+import math
+
+from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel
+
+
+def test_hata_models_match_closed_form():
+    ch = AdvancedChannel(base_station_height=30.0, mobile_height=1.5, terrain="suburban")
+    f = ch.base.frequency_hz / 1e6
+    a_hm = (1.1 * math.log10(f) - 0.7) * 1.5 - (1.56 * math.log10(f) - 0.8)
+    slope = 44.9 - 6.55 * math.log10(30.0)
+    d_km = 2.5
+    cost231 = 46.3 + 33.9 * math.log10(f) - 13.82 * math.log10(30.0) - a_hm + slope * math.log10(d_km)
+    hata = 69.55 + 26.16 * math.log10(f) - 13.82 * math.log10(30.0) - a_hm + slope * math.log10(d_km)
+    hata -= 2 * (math.log10(f / 28.0)) ** 2 - 5.4
+    assert math.isclose(ch._cost231_loss(2500.0), cost231, rel_tol=1e-12)
+    assert math.isclose(ch._okumura_hata_loss(2500.0), hata, rel_tol=1e-12)
@@ -0,0 +1,21 @@
+import math
+
+from simulateur_lora_sfrd.launcher.channel import Channel
+
+
+def test_airtime_cache_tracks_channel_parameters():
+    ch = Channel()
+    t125 = ch.airtime(7, 20)
+    assert ch.airtime(7, 20) == t125
+    ch.bandwidth = 250e3
+    assert math.isclose(ch.airtime(7, 20), t125 / 2, rel_tol=1e-9)
+    other = Channel(bandwidth=500e3)
+    assert math.isclose(other.airtime(7, 20), t125 / 4, rel_tol=1e-9)
+
+
+def test_bitrate_cache_tracks_channel_parameters():
+    ch = Channel()
+    assert ch._bitrate(125e3, 1, 7) == 7 * 125e3 * 4.0 / (128 * 5)
+    ch.coding_rate = 4
+    assert math.isclose(ch._bitrate(ch.bandwidth, ch.coding_rate, 7), 7 * 125e3 / 256)
+
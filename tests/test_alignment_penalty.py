@@ -0,0 +1,75 @@
+import math
+
+import pytest
+
+from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel
+
+
+def test_interference_penalty_values():
+    ch = AdvancedChannel(bandwidth=125e3)
+    assert ch._interference_penalty_db(0.0, 0.0, 0.0, 7) == 0.0
+    # Half the bandwidth away and one full symbol late: fully separated
+    assert ch._interference_penalty_db(62.5e3, 2 ** 7 / 125e3, 0.0, 7) == float("inf")
+    expected = 10 * math.log10(1.0 + 1.5 * (0.5 ** 2 + 0.25 ** 2 + math.sin(0.5) ** 2))
+    got = ch._interference_penalty_db(-31.25e3, 2 ** 9 / 125e3 / 4, 1.0, 9)
+    assert math.isclose(got, expected, rel_tol=1e-12)
+
+
+def test_symbol_time_table_follows_bandwidth():
+    ch = AdvancedChannel(bandwidth=125e3)
+    slow = ch._interference_penalty_db(0.0, 1e-3, 0.0, 7)
+    ch.base.bandwidth = 250e3
+    fast = ch._interference_penalty_db(0.0, 1e-3, 0.0, 7)
+    assert math.isclose(fast, 10 * math.log10(1.0 + 1.5 * (1e-3 / (2 ** 7 / 250e3)) ** 2))
+    assert fast > slow
+
+
+def test_directional_gain_pattern():
+    ch = AdvancedChannel()
+    assert ch._directional_gain(0.0) == 0.0
+    assert math.isclose(ch._directional_gain(math.pi / 4), 10 * math.log10(0.5))
+    floor = 10 * math.log10(1e-3)
+    for angle in (math.pi / 2 - 0.01, math.pi / 2, 2.0, math.pi, -math.pi):
+        assert math.isclose(ch._directional_gain(angle), floor)
+
+
+def test_interference_penalty_wraps_large_phase():
+    ch = AdvancedChannel(bandwidth=125e3)
+    for phase in (0.7, -2.5, 3.0):
+        ref = ch._interference_penalty_db(1e3, 1e-4, phase, 7)
+        for k in (-7, 3, 1000):
+            got = ch._interference_penalty_db(1e3, 1e-4, phase + k * math.tau, 7)
+            assert math.isclose(got, ref, rel_tol=1e-9)
+
+
+def test_interference_penalty_small_phase():
+    ch = AdvancedChannel(bandwidth=125e3)
+    for phase in (1e-7, -5e-7, 2e-6):
+        expected = 10 * math.log10(1.0 + 1.5 * ((2e3 / 62.5e3) ** 2 + math.sin(phase / 2) ** 2))
+        got = ch._interference_penalty_db(2e3, 0.0, phase, 7)
+        assert math.isclose(got, expected, rel_tol=1e-12)
+
+
+def test_numba_alignment_kernels_match_python():
+    from simulateur_lora_sfrd.launcher import advanced_channel as ac
+
+    if ac.njit is None:
+        pytest.skip("numba not installed")
+    fos = [0.0, 1e3, -40e3, 70e3, 62.5e3, 2e3]
+    sos = [0.0, 1e-4, 2e-3, 5e-2, 2 ** 7 / 125e3, 0.0]
+    pos = [0.0, 0.3, -2.0, 7.5, 0.0, 1e-7]
+    sfs = [7, 8, None, 12, 7, 9]
+    table = ac._symbol_times(125e3)
+    expected = [
+        ac._alignment_penalty_db(fo, so, po, table[sf], 62.5e3)
+        for fo, so, po, sf in zip(fos, sos, pos, sfs)
+    ]
+    got = [
+        ac._alignment_penalty_kernel(fo, so, po, table[sf], 62.5e3)
+        for fo, so, po, sf in zip(fos, sos, pos, sfs)
+    ]
+    for g, e in zip(got, expected):
+        if math.isinf(e):
+            assert math.isinf(g) and g > 0
+        else:
+            assert math.isclose(g, e, rel_tol=1e-12, abs_tol=1e-15)
@@ -0,0 +1,27 @@
+import pytest
+
+from simulateur_lora_sfrd import Application, LoRaMAC, Node
+
+
+def test_fire_schedules_next_event():
+    app = Application(LoRaMAC(Node(0, 0, 0, 7, 14)), interval=2.0)
+    assert app.next_event_time() == 0.0
+    app.fire()
+    assert app.next_event_time() == 2.0
+    app.fire(5.0)
+    assert app.next_event_time() == 7.0
+
+
+def test_step_matches_fire():
+    app = Application(LoRaMAC(Node(0, 0, 0, 7, 14)), interval=3.0)
+    assert app.step(0.0) is not None
+    assert app.step(1.0) is None
+    assert app.next_event_time() == 3.0
+
+
+def test_non_positive_interval_rejected():
+    mac = LoRaMAC(Node(0, 0, 0, 7, 14))
+    with pytest.raises(ValueError):
+        Application(mac, interval=0.0)
+    with pytest.raises(ValueError):
+        Application(mac, interval=-1.0)
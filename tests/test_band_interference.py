@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel
+from simulateur_lora_sfrd.launcher.channel import Channel
+
+
+def test_band_interference_cached_and_invalidated():
+    ch = AdvancedChannel(
+        frequency_hz=868e6,
+        bandwidth=125e3,
+        adjacent_interference_dB=10.0,
+        band_interference=[(868e6, 125e3, 5.0), (868.2e6, 125e3, 12.0), (869e6, 125e3, 30.0)],
+    )
+    assert ch._band_interference_dB() == 5.0 + 2.0
+    ch.base.band_interference.append((868.05e6, 125e3, 1.0))
+    assert ch._band_interference_dB() == 5.0 + 2.0 + 1.0
+    ch.base.adjacent_interference_dB = 0.0
+    assert ch._band_interference_dB() == 6.0
+
+
+def test_channel_noise_floor_humidity_offset():
+    dry = Channel(phy_model="", shadowing_std=0.0).noise_floor_dBm()
+    humid = Channel(
+        phy_model="", shadowing_std=0.0, humidity_percent=50.0, humidity_noise_coeff_dB=2.0
+    ).noise_floor_dBm()
+    assert math.isclose(humid - dry, 1.0, rel_tol=1e-9)
+
+
+def test_channel_band_interference_power_cached_and_invalidated():
+    ch = Channel(
+        phy_model="",
+        frequency_hz=868e6,
+        bandwidth=125e3,
+        frontend_filter_order=0,
+        band_interference=[(868e6, 125e3, -100.0)],
+    )
+    assert math.isclose(ch._band_interference_mW(), 1e-10)
+    ch.band_interference.append((868.05e6, 125e3, -97.0))
+    assert math.isclose(ch._band_interference_mW(), 1e-10 + 10 ** -9.7)
+    ch.frequency_hz = 870e6
+    assert ch._band_interference_mW() == 0.0
+
+
+def test_band_interference_edits_invalidate_noise_floor():
+    ch = Channel(
+        phy_model="",
+        shadowing_std=0.0,
+        frequency_hz=868e6,
+        bandwidth=125e3,
+        band_interference=[[868e6, 125e3, -100.0]],
+    )
+    quiet = ch.noise_floor_dBm()
+    # Entries are frozen: in-place edits of an entry fail loudly
+    assert ch.band_interference[0] == (868e6, 125e3, -100.0)
+    with pytest.raises(TypeError):
+        ch.band_interference[0][2] = -60.0
+    ch.band_interference[0] = (868e6, 125e3, -60.0)
+    loud = ch.noise_floor_dBm()
+    assert math.isclose(loud, 10 * math.log10(10 ** (quiet / 10) - 1e-10 + 1e-6))
+    ch.band_interference = [(868e6, 125e3, -100.0)]
+    assert math.isclose(ch.noise_floor_dBm(), quiet)
+    ch.band_interference.clear()
+    assert ch.noise_floor_dBm() < quiet
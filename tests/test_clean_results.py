@@ -0,0 +1,36 @@
+from simulateur_lora_sfrd.launcher.clean_results import clean_csv
+
+
+def test_clean_csv_streams_without_pandas(tmp_path):
+    src = tmp_path / "results.csv"
+    src.write_text(
+        "event_id,node_id,rssi\n"
+        "10,1,-90.5\n"
+        "2,1,-88.0\n"
+        "10,1,-90.5\n"
+        "3,,-80.0\n"
+        "4,2,NaN\n"
+        "\n"
+        "1,3,-70.25\n"
+    )
+    cleaned = clean_csv(str(src), use_pandas=False)
+    assert cleaned == str(tmp_path / "results_clean.csv")
+    assert (tmp_path / "results_clean.csv").read_text() == (
+        "event_id,node_id,rssi\n"
+        "1,3,-70.25\n"
+        "2,1,-88.0\n"
+        "10,1,-90.5\n"
+    )
+
+
+def test_clean_csv_falls_back_without_pandas(tmp_path, monkeypatch):
+    from simulateur_lora_sfrd.launcher import clean_results
+
+    monkeypatch.setattr(clean_results, "pd", None)
+    src = tmp_path / "results.csv"
+    src.write_text("event_id,rssi\n2,-80.0\n1,-90.0\n2,-80.0\n")
+    cleaned = clean_csv(str(src))
+    assert (tmp_path / "results_clean.csv").read_text() == (
+        "event_id,rssi\n1,-90.0\n2,-80.0\n"
+    )
+    assert cleaned == str(tmp_path / "results_clean.csv")
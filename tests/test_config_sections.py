@@ -0,0 +1,73 @@
+import configparser
+from pathlib import Path
+
+import pytest
+
+from simulateur_lora_sfrd.launcher.config_loader import (
+    _parse_flora_sections,
+    load_config,
+    write_flora_ini,
+)
+
+
+def _configparser_sections(text):
+    cp = configparser.ConfigParser()
+    cp.read_string(text)
+    return {
+        name: [value for _, value in cp.items(name)]
+        for name in ("gateways", "nodes")
+        if cp.has_section(name)
+    }
+
+
+def test_fast_sections_match_configparser(tmp_path):
+    ini = tmp_path / "scenario.ini"
+    nodes = [{"x": 1.0, "y": 2.0, "sf": 9, "tx_power": 11.0}, {"x": 5.0, "y": 6.0}]
+    write_flora_ini(nodes, [{"x": 3.0, "y": 4.0}], ini, next_interval=10.0)
+    text = ini.read_text() + "\n[extra]\n; comment\nfoo: bar\n"
+    sections = _parse_flora_sections(text)
+    assert sections == _configparser_sections(text)
+    examples = Path(__file__).parent.parent / "flora-master" / "simulations" / "examples"
+    inis = sorted(examples.glob("*.ini"))
+    assert inis
+    for path in inis:
+        text = path.read_text()
+        assert _parse_flora_sections(text) == _configparser_sections(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[nodes]\nn0 = 1,2\n  ,7\n",
+        "[nodes]\nn0 = 1,2\nN0 = 3,4\n",
+        "[DEFAULT]\nsf = 9\n[nodes]\nn0 = 1,2\n",
+        "[nodes]\nn0 = %(x)s,2\n",
+        "n0 = 1,2\n[nodes]\n",
+    ],
+)
+def test_unusual_syntax_falls_back(tmp_path, text):
+    assert _parse_flora_sections(text) is None
+    ini = tmp_path / "scenario.ini"
+    ini.write_text(text)
+    try:
+        expected = _configparser_sections(text)
+    except configparser.Error as exc:
+        with pytest.raises(type(exc)):
+            load_config(ini)
+    else:
+        nodes, _, _, _ = load_config(ini)
+        assert len(nodes) == sum("," in v for v in expected.get("nodes", []))
+
+
+def test_load_config_tolerates_spaced_fields(tmp_path):
+    ini = tmp_path / "scenario.ini"
+    ini.write_text(
+        "[gateways]\ngw0 = 10 , 20\n"
+        "[nodes]\nn0 = 1.5,\t2.5 , 9 , 11.0\nn1 = 3,4\nn2 = 5\n"
+    )
+    nodes, gateways, _, _ = load_config(ini)
+    assert gateways == [{"x": 10.0, "y": 20.0}]
+    assert nodes == [
+        {"x": 1.5, "y": 2.5, "sf": 9, "tx_power": 11.0},
+        {"x": 3.0, "y": 4.0, "sf": 7, "tx_power": 14.0},
+    ]
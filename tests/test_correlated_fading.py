@@ -0,0 +1,95 @@
+import math
+import random
+
+import numpy as np
+
+from simulateur_lora_sfrd.launcher.advanced_channel import (
+    _CorrelatedFading,
+    _CorrelatedValue,
+    _GammaPool,
+    _GaussianPool,
+)
+
+
+def _reference_sample(i, q, rng, k, corr, paths):
+    std = math.sqrt(max(1.0 - corr ** 2, 0.0))
+    mean_i = math.sqrt(k / (k + 1.0))
+    sigma = math.sqrt(1.0 / (2.0 * (k + 1.0)))
+    for p in range(paths):
+        i[p] = corr * i[p] + std * rng.normal(mean_i, sigma)
+        q[p] = corr * q[p] + std * rng.normal(0.0, sigma)
+    amp = math.sqrt(sum(i) ** 2 + sum(q) ** 2) / paths
+    return 20 * math.log10(max(amp, 1e-12))
+
+
+def test_multipath_fading_matches_reference():
+    for paths in (1, 4):
+        fading = _CorrelatedFading(
+            "rician", 2.0, 0.8, paths=paths,
+            rng=np.random.Generator(np.random.MT19937(3)),
+        )
+        rng = np.random.Generator(np.random.MT19937(3))
+        i = [0.0] * paths
+        q = [0.0] * paths
+        for _ in range(20):
+            expected = _reference_sample(i, q, rng, 2.0, 0.8, paths)
+            assert math.isclose(fading.sample_db(), expected, rel_tol=1e-12)
+
+
+def test_sum_of_sinusoids_unit_power():
+    fading = _CorrelatedFading(
+        "rayleigh", 0.0, 0.9, rng=np.random.Generator(np.random.MT19937(1)),
+        method="sos", n_sinusoids=16, doppler=0.37,
+    )
+    samples = [10 ** (fading.sample_db() / 10) for _ in range(5000)]
+    assert 0.8 <= sum(samples) / len(samples) <= 1.2
+
+
+def test_gaussian_pool_draws_by_blocks(fake_rng):
+    rng = fake_rng(1, scalar_draws=False)
+    ref = random.Random(1)
+    draw = _GaussianPool(rng, 3).draw
+    assert [draw() for _ in range(5)] == [ref.gauss(0.0, 1.0) for _ in range(5)]
+    assert rng.calls == 2
+    # Generators without array draws keep scalar calls
+    ref = random.Random(1)
+    draw = _GaussianPool(fake_rng(1, blocks=False), 3).draw
+    assert [draw() for _ in range(4)] == [ref.gauss(0.0, 1.0) for _ in range(4)]
+
+
+def test_disabled_correlated_value_skips_rng(fake_rng):
+    rng = fake_rng(2, scalar_draws=False)
+    value = _CorrelatedValue(290.0, 0.0, 0.9, rng=rng)
+    assert [value.sample() for _ in range(3)] == [290.0] * 3
+    # Enabling the process later resumes the random walk
+    value._gauss = _GaussianPool(rng, 2).draw
+    value.std = 1.0
+    g = random.Random(2).gauss(0.0, 1.0)
+    assert value.sample() == 290.0 + g
+    value.std = 0.0
+    assert value.sample() == 0.9 * (290.0 + g) + (1.0 - 0.9) * 290.0
+
+
+def test_nakagami_gamma_pool(fake_rng):
+    rng = fake_rng(3, scalar_draws=False)
+    fading = _CorrelatedFading("nakagami", 0.05, 0.0, rng=rng)
+    assert (fading._nak_shape, fading._nak_scale) == (0.1, 10.0)
+    fading._gamma = _GammaPool(rng, fading._nak_shape, fading._nak_scale, 2).draw
+    ref = random.Random(3)
+    for _ in range(2):
+        expected = 20 * math.log10(math.sqrt(ref.gammavariate(0.1, 10.0)))
+        assert math.isclose(fading.sample_db(), expected)
+    assert rng.calls == 1
+
+
+def test_channel_disabled_correlated_value_skips_rng():
+    from simulateur_lora_sfrd.launcher.channel import _CorrelatedValue as _ChannelValue
+
+    class _NoDraw:
+        def normal(self, *args):
+            raise AssertionError("disabled process must not draw")
+
+    value = _ChannelValue(290.0, 0.0, 0.9, rng=_NoDraw())
+    assert [value.sample() for _ in range(3)] == [290.0] * 3
+    value.value = 300.0
+    assert value.sample() == 0.9 * 300.0 + (1.0 - 0.9) * 290.0
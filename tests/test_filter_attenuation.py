@@ -0,0 +1,25 @@
+import math
+
+from simulateur_lora_sfrd.launcher.channel import Channel, _butterworth_attenuation_db
+
+
+def test_filter_attenuation_exact_for_narrow_filters():
+    # Narrow filters and high orders: the steep transition band is exact
+    for order, filter_bw, bandwidth in ((8, 10e3, 500e3), (4, 10e3, 500e3), (8, 20e3, 125e3)):
+        ch = Channel(
+            bandwidth=bandwidth, frontend_filter_order=order, frontend_filter_bw=filter_bw
+        )
+        fc = filter_bw / 2.0
+        for f in (0.0, 0.9 * fc, fc, 1.1 * fc, 1.7 * fc, 3 * fc, bandwidth):
+            expected = 10 * math.log10(1.0 + (f / fc) ** (2 * order))
+            assert math.isclose(ch._filter_attenuation_db(f), expected, rel_tol=1e-12)
+    ch.frontend_filter_order = 0
+    assert ch._filter_attenuation_db(80e3) == 0.0
+
+
+def test_butterworth_small_orders_match_pow():
+    for order in range(1, 7):
+        for f in (1e3, 37e3, 50e3, 80e3, 1e6):
+            expected = 10 * math.log10(1.0 + (f / 50e3) ** (2 * order))
+            got = _butterworth_attenuation_db(f, 50e3, order)
+            assert math.isclose(got, expected, rel_tol=1e-12, abs_tol=1e-15)
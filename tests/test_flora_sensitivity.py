@@ -33,3 +33,43 @@ def test_flora_noise_path_loading():
     path = Path('flora-master/src/LoRaPhy/LoRaAnalogModel.cc')
     ch = Channel(flora_noise_path=path)
     assert ch.flora_noise_table == parse_flora_sensitivity()
+
+
+def test_flora_noise_table_parsed_once(tmp_path, monkeypatch):
+    src = Path('flora-master/src/LoRaPhy/LoRaAnalogModel.cc')
+    path = tmp_path / 'LoRaAnalogModel.cc'
+    path.write_text(src.read_text())
+    calls = []
+    original = Channel._read_flora_noise_table
+
+    def counting(real):
+        calls.append(real)
+        return original(real)
+
+    monkeypatch.setattr(Channel, '_read_flora_noise_table', staticmethod(counting))
+    first = Channel.parse_flora_noise_table(path)
+    assert Channel.parse_flora_noise_table(str(path)) == first
+    assert Channel(flora_noise_path=path).flora_noise_table == first
+    assert len(calls) == 1
+
+
+def test_flora_noise_table_copies_are_independent(tmp_path):
+    src = Path('flora-master/src/LoRaPhy/LoRaAnalogModel.cc')
+    path = tmp_path / 'LoRaAnalogModel.cc'
+    path.write_text(src.read_text())
+    ch = Channel(flora_noise_path=path)
+    ch.flora_noise_table[7][125000] = 0
+    fresh = Channel.parse_flora_noise_table(path)
+    assert fresh[7][125000] == parse_flora_sensitivity()[7][125000]
+    assert fresh is not ch.flora_noise_table
+
+
+def test_flora_noise_follows_table_updates():
+    ch = Channel(bandwidth=125000)
+    ch.flora_noise_table = {7: {125000: -120}}
+    assert ch._flora_noise_dBm(7) == -120
+    ch.flora_noise_table = {7: {125000: -100}}
+    assert ch._flora_noise_dBm(7) == -100
+    ch.flora_noise_table[7][125000] = -90
+    assert ch._flora_noise_dBm(7) == -90
+    assert ch._flora_noise_dBm(12) == -126.5
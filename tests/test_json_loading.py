@@ -0,0 +1,32 @@
+import json
+import math
+
+from simulateur_lora_sfrd.launcher.config_loader import load_config, load_json
+from simulateur_lora_sfrd.launcher.map_loader import load_map
+
+
+def test_load_config_json(tmp_path):
+    path = tmp_path / "scenario.json"
+    path.write_text(json.dumps({
+        "gateways": [{"x": 1, "y": 2}],
+        "nodes": [{"x": 3.5, "y": 4, "sf": 9}],
+    }))
+    nodes, gws, next_i, first_i = load_config(path)
+    assert gws == [{"x": 1.0, "y": 2.0}]
+    assert nodes == [{"x": 3.5, "y": 4.0, "sf": 9, "tx_power": 14.0}]
+    assert next_i is None and first_i is None
+
+
+def test_load_map_json(tmp_path):
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps([[0, 1.5], ["wall", 2]]))
+    assert load_map(path) == [[0.0, 1.5], ["wall", 2.0]]
+
+
+def test_load_json_accepts_nan(tmp_path):
+    path = tmp_path / "values.json"
+    path.write_text('{"x": NaN, "y": Infinity, "z": 1}')
+    data = load_json(path)
+    assert math.isnan(data["x"])
+    assert data["y"] == float("inf")
+    assert data["z"] == 1
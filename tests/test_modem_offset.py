@@ -0,0 +1,17 @@
+import random
+
+import numpy as np
+
+from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel
+
+
+def test_bound_modem_offset_applies_by_default():
+    offsets = {"sx1276": -1.5}
+    random.seed(0)
+    bound_ch = AdvancedChannel(modem_snr_offsets=offsets, rng=np.random.Generator(np.random.MT19937(2)))
+    bound_ch.bind_modem("sx1276")
+    _, bound = bound_ch.compute_rssi(14.0, 100.0, 7)
+    random.seed(0)
+    ch = AdvancedChannel(modem_snr_offsets=offsets, rng=np.random.Generator(np.random.MT19937(2)))
+    _, explicit = ch.compute_rssi(14.0, 100.0, 7, modem="sx1276")
+    assert bound == explicit
@@ -21,3 +21,24 @@ def test_sensitivity_matches_theory():
     for sf, req in snr_req.items():
         expected = noise_floor + req
         assert math.isclose(ch.sensitivity_dBm[sf], expected, abs_tol=0.1)
+
+
+def test_sensitivity_is_computed_lazily():
+    ch = Channel()
+    assert "sensitivity_dBm" not in ch.__dict__
+    before = ch.sensitivity_dBm[7]
+    ch.noise_figure_dB += 3.0
+    assert ch.sensitivity_dBm[7] == before
+    ch._update_sensitivity()
+    assert math.isclose(ch.sensitivity_dBm[7], before + 3.0)
+    # Dropping the cached table directly is enough as well
+    ch.noise_figure_dB -= 3.0
+    del ch.__dict__["sensitivity_dBm"]
+    assert math.isclose(ch.sensitivity_dBm[7], before)
+
+
+def test_multipath_block_draw_matches_scalar_draws(fake_rng):
+    scalar = Channel(multipath_taps=4, rng=fake_rng(3, blocks=False))
+    block = Channel(multipath_taps=4, rng=fake_rng(3))
+    expected = [scalar._multipath_fading_db() for _ in range(5)]
+    assert [block._multipath_fading_db() for _ in range(5)] == expected
@@ -0,0 +1,50 @@
+import math
+
+from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel, _obstacle_walk
+
+
+def _channel(**kwargs):
+    return AdvancedChannel(propagation_model="", fading="", map_area_size=100.0, **kwargs)
+
+
+def test_obstacle_loss_sums_crossed_cells():
+    ch = _channel(
+        obstacle_map=[[0, "wall", 0, 2.5]],
+        obstacle_losses={"wall": 7.0},
+    )
+    assert math.isclose(ch._obstacle_loss((0.0, 0.0), (99.0, 0.0)), 9.5)
+    # Cells outside the segment are ignored
+    assert ch._obstacle_loss((0.0, 0.0), (40.0, 0.0)) == 7.0
+
+
+def test_obstacle_height_and_blocking():
+    ch = _channel(
+        obstacle_map=[[0, 3.0, 0, 0]],
+        obstacle_height_map=[[0, 10.0, 0, 0]],
+        default_obstacle_dB=4.0,
+    )
+    assert ch._obstacle_loss((0.0, 0.0, 5.0), (99.0, 0.0, 5.0)) == 3.0
+    assert ch._obstacle_loss((0.0, 0.0, 20.0), (99.0, 0.0, 20.0)) == 3.0
+    blocked = _channel(obstacle_map=[[0, -1, 0, 0]])
+    assert blocked._obstacle_loss((0.0, 0.0), (99.0, 0.0)) == float("inf")
+
+
+def test_obstacle_walk_kernel_matches_channel():
+    ch = _channel(
+        obstacle_map=[[0, "wall", 1.0], [2.0, 0, -1], [0, 0.5, 0]],
+        obstacle_height_map=[[0, 12.0, 0], [0, 0, 0], [8.0, 0, 0]],
+        obstacle_losses={"wall": 6.0},
+        default_obstacle_dB=3.0,
+    )
+    obstacles, heights = ch._flatten_obstacle_maps()
+    for tx, rx in [
+        ((0.0, 0.0, 5.0), (99.0, 10.0, 5.0)),
+        ((0.0, 90.0, 1.0), (99.0, 90.0, 20.0)),
+        ((10.0, 10.0, 0.0), (90.0, 90.0, 0.0)),
+    ]:
+        expected = ch._obstacle_loss(tx, rx)
+        got = _obstacle_walk(
+            obstacles, heights, 3, 3, 100.0,
+            tx[0], tx[1], tx[2], rx[0] - tx[0], rx[1] - tx[1], rx[2] - tx[2], 3.0,
+        )
+        assert got == expected
@@ -11,3 +11,23 @@ def test_pa_ramp_up_affects_rssi():
     ch.omnet_phy.update(0.6)
     r2, _ = ch.compute_rssi(14.0, 10.0)
     assert r2 > r1
+
+
+def test_advanced_channel_tx_ramp_states():
+    from simulateur_lora_sfrd.launcher.advanced_channel import AdvancedChannel
+
+    ch = AdvancedChannel(tx_start_delay_s=0.1, pa_ramp_up_s=1.0, pa_ramp_down_s=0.5)
+    steady = AdvancedChannel()
+    ch.start_tx()
+    AdvancedChannel.update_many([ch, steady], 0.2)
+    assert ch.tx_state == "ramping_up"
+    ch.update(0.5)
+    assert ch._tx_level == 0.5
+    ch.update(0.6)
+    assert (ch.tx_state, ch._tx_level) == ("on", 1.0)
+    ch.stop_tx()
+    ch.update(0.25)
+    assert ch._tx_level == 0.5
+    ch.update(0.3)
+    assert (ch.tx_state, ch._tx_level) == ("off", 0.0)
+    assert steady.tx_state == "on"
@@ -0,0 +1,29 @@
+from simulateur_lora_sfrd.launcher.simulator import Simulator
+
+
+def _sim():
+    return Simulator(
+        num_nodes=1,
+        num_gateways=1,
+        area_size=10.0,
+        transmission_mode="Periodic",
+        packet_interval=10.0,
+        packets_to_send=2,
+        mobility=False,
+        fixed_sf=7,
+        seed=1,
+    )
+
+
+def test_reception_follows_edited_sensitivity_table():
+    sim = _sim()
+    sim.run()
+    assert sim.packets_delivered == 2
+
+    sim = _sim()
+    channel = sim.nodes[0].channel
+    # Look the table up once before editing it in place
+    assert channel.sensitivity_dBm[7] < -100.0
+    channel.sensitivity_dBm[7] = 100.0
+    sim.run()
+    assert sim.packets_delivered == 0
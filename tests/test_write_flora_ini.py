@@ -2,6 +2,7 @@ from simulateur_lora_sfrd.launcher.config_loader import (
     write_flora_ini,
     parse_flora_interval,
     parse_flora_first_interval,
+    load_config,
 )
 
 
@@ -12,3 +13,15 @@ def test_write_intervals(tmp_path):
     write_flora_ini(nodes, gateways, ini, next_interval=7.5, first_interval=1.5)
     assert parse_flora_interval(ini) == 7.5
     assert parse_flora_first_interval(ini) == 7.5
+
+
+def test_load_config_first_interval_only(tmp_path):
+    ini = tmp_path / "scenario.ini"
+    nodes = [{"x": 1.0, "y": 2.0, "sf": 9}]
+    gateways = [{"x": 3.0, "y": 4.0}]
+    write_flora_ini(nodes, gateways, ini, first_interval=1.5)
+    loaded_nodes, loaded_gws, next_i, first_i = load_config(ini)
+    assert next_i is None
+    assert first_i == 1.5 == parse_flora_first_interval(ini)
+    assert loaded_nodes[0]["sf"] == 9
+    assert loaded_gws == [{"x": 3.0, "y": 4.0}]